@@ -0,0 +1,135 @@
+"""
+animation_cache.py
+
+Content-addressed hashes for Manim's partial movie file cache.
+
+Manim names each play's partial movie file after a hash of the JSON dump of the camera,
+the animations and every mobject on screen. That dump is sensitive to how the scene got
+to its current state (memoized references, attribute bookkeeping, the camera's last
+frame). In practice, editing one early play in a long scene such as TaylorProofCos
+changes the names of the later segments too, so they are all re-rendered.
+
+semantic_play_hash keys a play on what its frames are made of instead: the camera
+settings, each animation's class and parameters, and the content of every mobject on
+screen. Content is points, colors, widths, z-index, submobject order, the code plus
+captured values of updaters and rate functions, and the attributes of any other object
+they hold. The scene, camera, renderer and modules count by type only. Two plays that
+would draw the same frames get the same name wherever they sit in the scene, so a
+mid-scene edit re-renders only the segments it actually changes. enable_semantic_cache
+installs it in the Cairo renderer.
+
+Functions:
+- content_hash(*values): Hex digest of mobjects, animations, functions, plain objects and data.
+- semantic_play_hash(scene, camera, animations, mobjects): Drop-in for get_hash_from_play_call.
+- enable_semantic_cache(): Use semantic_play_hash for every following play.
+
+Dependencies: Requires Manim and numpy.
+
+"""
+
+from enum import Enum
+import functools
+import hashlib
+import types
+import numpy as np
+from manim import *
+import manim.renderer.cairo_renderer as cairo_renderer
+
+CAMERA_ATTRS = ["pixel_width", "pixel_height", "frame_width", "frame_height", "frame_center", "frame_rate", "background_color", "background_opacity"]
+# Hashed by type only: the play's context rather than its content
+OPAQUE_TYPES = (Scene, Camera, SceneFileWriter, cairo_renderer.CairoRenderer, types.ModuleType)
+_settings = {"installed": False}
+
+
+def _feed_function(digest, function, seen):
+    code = function.__code__
+    _feed(digest, [function.__qualname__, code, function.__defaults__], seen)
+    for cell in function.__closure__ or ():
+        try:
+            _feed(digest, cell.cell_contents, seen)
+        except ValueError:
+            # Cell of a variable that has not been assigned yet
+            digest.update(b"empty cell")
+    for name in code.co_names:
+        # Data the function reads from module globals; modules and library functions by name only
+        value = function.__globals__.get(name)
+        if isinstance(value, (Mobject, np.ndarray, list, tuple, dict, int, float, str)):
+            _feed(digest, value, seen)
+        elif value is not None:
+            digest.update(f"{name}:{getattr(value, '__qualname__', type(value).__qualname__)}".encode())
+
+
+def _feed_object(digest, value, seen):
+    # Mobjects, animations, functions and other objects can be shared or cyclic: hash each once, then by first-visit order
+    if id(value) in seen:
+        digest.update(f"ref{seen[id(value)]}".encode())
+        return
+    seen[id(value)] = len(seen)
+    digest.update(type(value).__qualname__.encode())
+    if isinstance(value, types.FunctionType):
+        _feed_function(digest, value, seen)
+    elif isinstance(value, types.MethodType):
+        _feed(digest, [value.__func__, value.__self__], seen)
+    elif isinstance(value, functools.partial):
+        _feed(digest, [value.func, value.args, value.keywords], seen)
+    else:
+        _feed(digest, {key: item for key, item in vars(value).items() if key != "submobjects"}, seen)
+        _feed(digest, getattr(value, "submobjects", []), seen)
+
+
+def _feed(digest, value, seen):
+    if value is None or isinstance(value, (bool, int, float, complex, str, np.generic, Enum, ManimColor)):
+        digest.update(repr(value).encode())
+    elif isinstance(value, bytes):
+        digest.update(value)
+    elif isinstance(value, np.ndarray):
+        digest.update(f"{value.dtype}{value.shape}".encode())
+        if value.dtype == object:
+            _feed(digest, value.tolist(), seen)
+        else:
+            digest.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value, (list, tuple)):
+        digest.update(b"[")
+        for item in value:
+            _feed(digest, item, seen)
+        digest.update(b"]")
+    elif isinstance(value, (set, frozenset)):
+        digest.update(repr(sorted(map(repr, value))).encode())
+    elif isinstance(value, dict):
+        digest.update(b"{")
+        for key in sorted(value, key=repr):
+            _feed(digest, key, seen)
+            _feed(digest, value[key], seen)
+        digest.update(b"}")
+    elif isinstance(value, types.CodeType):
+        _feed(digest, [value.co_code, value.co_consts, value.co_names], seen)
+    elif isinstance(value, type):
+        digest.update(f"{value.__module__}.{value.__qualname__}".encode())
+    elif isinstance(value, OPAQUE_TYPES):
+        digest.update(type(value).__qualname__.encode())
+    elif isinstance(value, (Mobject, Animation, types.FunctionType, types.MethodType, functools.partial)) or hasattr(value, "__dict__"):
+        _feed_object(digest, value, seen)
+    else:
+        # No attributes to read (builtins, ufuncs, slotted objects): their type and name
+        digest.update(f"{type(value).__qualname__}:{getattr(value, '__qualname__', getattr(value, '__name__', ''))}".encode())
+
+
+def content_hash(*values):
+    digest = hashlib.sha256()
+    _feed(digest, list(values), {})
+    return digest.hexdigest()[:16]
+
+
+def semantic_play_hash(scene_object, camera_object, animations_list, current_mobjects_list):
+    """Same signature and "<camera>_<animations>_<mobjects>" shape as Manim's get_hash_from_play_call."""
+    camera = content_hash([getattr(camera_object, attr, None) for attr in CAMERA_ATTRS])
+    animations = content_hash(*animations_list)
+    mobjects = content_hash(list(current_mobjects_list), scene_object.foreground_mobjects)
+    return f"{camera}_{animations}_{mobjects}"
+
+
+def enable_semantic_cache():
+    if _settings["installed"]:
+        return
+    _settings["installed"] = True
+    cairo_renderer.get_hash_from_play_call = semantic_play_hash
@@ -0,0 +1,110 @@
+"""
+axes_cache.py
+
+Shared Axes and a pre-rasterized background layer for the expansion scenes.
+
+CosExpansion, SinExpansion and eExpansion each build the same Axes((-6, 6), (-3, 3)), and
+TaylorSeriesExpansion builds a new Axes (number lines, ticks, tips) for each of its 13
+functions, most of them over the same few ranges. shared_axes builds each distinct Axes
+once per process and hands out copies, which skip the number line construction.
+
+Manim's Cairo renderer already draws the mobjects that do not move during a play into a
+static image once per play, but it re-strokes all of them at the start of every play.
+With enable_static_layer, the background() mobjects (shared_axes marks its axes) that
+come first among a play's static mobjects are rasterized into a background image, cached
+by content (camera settings and the mobjects' points and style) across plays. The play
+then draws the rest of its static mobjects over that image, as Manim does over a blank
+frame.
+
+Only a leading run of marked mobjects is taken from the cache, so the drawing order is
+the same as without it: a marked mobject added after an unmarked one is drawn in its
+place, as usual. Mobjects that move during a play are not in its static image at all.
+
+Functions:
+- shared_axes(x_range, y_range, **kwargs): A copy of the cached Axes for these arguments.
+- background(*mobjects): Mark mobjects (and their submobjects) as background layer.
+- enable_static_layer(maxsize): Cache the raster of the marked mobjects that lead each play's static image.
+
+Dependencies: Requires Manim and animation_cache.
+
+"""
+
+from collections import OrderedDict
+from manim import *
+import manim.renderer.cairo_renderer as cairo_renderer
+from animation_cache import CAMERA_ATTRS, content_hash
+
+stats = {"axes_hits": 0, "axes_misses": 0, "layer_hits": 0, "layer_misses": 0}
+_axes = {}
+_layers = OrderedDict()
+_settings = {"maxsize": 8, "installed": False}
+_wrapped = {}
+
+
+def shared_axes(x_range=None, y_range=None, **kwargs):
+    """Axes(x_range, y_range, **kwargs), built once per distinct arguments and frame size; marked as background."""
+    key = content_hash(x_range, y_range, kwargs, config.frame_width, config.frame_height)
+    if key in _axes:
+        stats["axes_hits"] += 1
+    else:
+        stats["axes_misses"] += 1
+        _axes[key] = background(Axes(x_range, y_range, **kwargs))
+    return _axes[key].copy()
+
+
+def background(*mobjects):
+    """Mark the families of mobjects as background layer; returns the mobject (or tuple of them)."""
+    for mobject in mobjects:
+        for member in mobject.get_family():
+            member.static_layer = True
+    return mobjects[0] if len(mobjects) == 1 else mobjects
+
+
+def _background_image(renderer, scene, layer):
+    key = content_hash([getattr(renderer.camera, attr, None) for attr in CAMERA_ATTRS], layer)
+    if key in _layers:
+        stats["layer_hits"] += 1
+        _layers.move_to_end(key)
+        return _layers[key]
+    stats["layer_misses"] += 1
+    renderer.static_image = None
+    renderer.update_frame(scene, mobjects=layer)
+    image = _layers[key] = renderer.get_frame()
+    while len(_layers) > _settings["maxsize"]:
+        _layers.popitem(last=False)
+    return image
+
+
+def _leading_layer(static_mobjects):
+    # The static image draws in list order; only a leading run of layer mobjects can come from a cached image
+    count = 0
+    for mobject in static_mobjects:
+        if not all(getattr(member, "static_layer", False) for member in mobject.get_family()):
+            break
+        count += 1
+    return static_mobjects[:count], static_mobjects[count:]
+
+
+def _layered_static_frame_data(self, scene, static_mobjects):
+    layer, rest = _leading_layer(static_mobjects)
+    if not layer:
+        return _wrapped["save_static_frame_data"](self, scene, static_mobjects)
+    self.static_image = _background_image(self, scene, layer)
+    if rest:
+        # update_frame starts from the static image, so this draws the rest on top of the layer
+        self.update_frame(scene, mobjects=rest)
+        self.static_image = self.get_frame()
+    return self.static_image
+
+
+def enable_static_layer(maxsize=8):
+    """
+    Reuse the raster of the background() mobjects that lead the static mobjects of every
+    following Cairo play, keeping the `maxsize` most recently used background images.
+    """
+    _settings.update(maxsize=maxsize)
+    if _settings["installed"]:
+        return
+    _settings["installed"] = True
+    _wrapped["save_static_frame_data"] = cairo_renderer.CairoRenderer.save_static_frame_data
+    cairo_renderer.CairoRenderer.save_static_frame_data = _layered_static_frame_data
@@ -0,0 +1,172 @@
+"""
+scenes.py
+
+Benchmark of every scene in taylor_series.py, newton_raphson.py and visualize_taylor_exp.py.
+
+Each scene is rendered at a fixed low resolution (SETTINGS) in its own process, twice on
+the same fresh media directory:
+
+- cold: nothing cached; every TeX expression is compiled and every play is rendered;
+- warm: the second run; the TeX, parsed-SVG and partial-movie caches of the first apply.
+
+For each run the child process renders the scene under render_profile and reports wall
+time, frames written, frames per second, its peak RSS, the cache-hit rates (TeX .svg
+files, svg_cache, partial movie files) and the time per render stage. The whole set is
+appended as one JSON line to --history, together with the commit and settings.
+
+The first run (or --set-baseline) is saved as the baseline. Later runs flag every scene
+whose wall time or peak RSS exceeds the baseline's by more than --threshold, and exit
+with status 1 if there is any.
+
+Usage: python benchmarks/scenes.py [--scenes Newton GeneralProof] [--threshold 0.1] [--set-baseline]
+
+Dependencies: Requires Manim, ffmpeg, LaTeX, render_profile and a Unix `resource` module (peak RSS).
+
+"""
+
+from datetime import datetime
+from pathlib import Path
+import argparse
+import ast
+import importlib
+import json
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+REPO = Path(__file__).resolve().parent.parent
+MODULES = ["taylor_series", "newton_raphson", "visualize_taylor_exp"]
+SETTINGS = {"pixel_width": 480, "pixel_height": 270, "frame_rate": 15}
+HISTORY = Path(__file__).with_name("scene_history.jsonl")
+BASELINE = Path(__file__).with_name("scene_baseline.json")
+COMPARED = ["wall_seconds", "peak_rss_mb"]
+
+
+def scene_names(module_name):
+    """Scene classes defined by a class statement in the module, in source order."""
+    tree = ast.parse((REPO / f"{module_name}.py").read_text(encoding="utf-8"))
+    scenes = []
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef):
+            bases = [base.id for base in node.bases if isinstance(base, ast.Name)]
+            if any(base.endswith("Scene") or base in scenes for base in bases):
+                scenes.append(node.name)
+    return scenes
+
+
+def _rate(hits, total):
+    return round(hits / total, 3) if total else None
+
+
+def _measure(module_name, scene_name, media_dir):
+    # Runs in the child process: the only render in it, so the peak RSS is this scene's
+    import resource
+    sys.path.insert(0, str(REPO))
+    from render_profile import profile_scene
+    scene_class = getattr(importlib.import_module(module_name), scene_name)
+    start = time.perf_counter()
+    report = profile_scene(scene_class, {**SETTINGS, "media_dir": media_dir}, Path(media_dir) / "profiles")
+    wall = time.perf_counter() - start
+    counters, svg, plays = report["counters"], report["svg_cache"], report["plays"]
+    frames = counters.get("frames", 0)
+    return {
+        "wall_seconds": round(wall, 3),
+        "frames": frames,
+        "fps": round(frames / wall, 2),
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        "tex_hit_rate": _rate(counters.get("tex_requests", 0) - counters.get("tex_compiles", 0), counters.get("tex_requests", 0)),
+        "svg_hit_rate": _rate(svg.get("hits", 0) + svg.get("disk_hits", 0), sum(svg.values())),
+        "movie_hit_rate": _rate(sum(play["skipped"] for play in plays), len(plays)),
+        "stages": {stage: round(seconds, 3) for stage, seconds in report["totals"].items()},
+    }
+
+
+def measure(module_name, scene_name, media_dir):
+    with tempfile.TemporaryDirectory() as scratch:
+        result_file = Path(scratch) / "result.json"
+        command = [sys.executable, __file__, "--worker", module_name, scene_name, media_dir, str(result_file)]
+        process = subprocess.run(command, cwd=REPO, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+        if process.returncode != 0:
+            return {"error": process.stderr.strip().splitlines()[-1:] or [f"exit status {process.returncode}"]}
+        return json.loads(result_file.read_text(encoding="utf-8"))
+
+
+def run(modules, only=None):
+    print(f"{'scene':<40} {'cache':>5} {'wall s':>8} {'frames':>7} {'fps':>7} {'RSS MB':>7} {'tex':>5} {'svg':>5} {'movie':>5}")
+    results = []
+    for module_name in modules:
+        for scene_name in scene_names(module_name):
+            if only and scene_name not in only:
+                continue
+            media_dir = tempfile.mkdtemp(prefix=f"bench_{scene_name}_")
+            try:
+                for cache in ("cold", "warm"):
+                    result = {"scene": f"{module_name}.{scene_name}", "cache": cache, **measure(module_name, scene_name, media_dir)}
+                    results.append(result)
+                    if "error" in result:
+                        print(f"{result['scene']:<40} {cache:>5} failed: {result['error']}")
+                        continue
+                    rates = [result[key] for key in ("tex_hit_rate", "svg_hit_rate", "movie_hit_rate")]
+                    print(
+                        f"{result['scene']:<40} {cache:>5} {result['wall_seconds']:>8.2f} {result['frames']:>7}"
+                        f" {result['fps']:>7.1f} {result['peak_rss_mb']:>7.0f}"
+                        + "".join(f" {'-' if rate is None else f'{rate:.0%}':>5}" for rate in rates)
+                    )
+            finally:
+                shutil.rmtree(media_dir, ignore_errors=True)
+    return results
+
+
+def regressions(results, baseline, threshold):
+    """Descriptions of every compared metric more than `threshold` (a fraction) above the baseline."""
+    previous = {(result["scene"], result["cache"]): result for result in baseline["results"]}
+    flagged = []
+    for result in results:
+        before = previous.get((result["scene"], result["cache"]))
+        if before is None or "error" in before or "error" in result:
+            continue
+        for metric in COMPARED:
+            if result[metric] > before[metric] * (1 + threshold):
+                flagged.append(f"{result['scene']} ({result['cache']}): {metric} {before[metric]} -> {result[metric]}")
+    return flagged
+
+
+def _commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=REPO, capture_output=True, text=True).stdout.strip() or None
+    except OSError:
+        return None
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--worker"]:
+        module_name, scene_name, media_dir, result_file = sys.argv[2:6]
+        Path(result_file).write_text(json.dumps(_measure(module_name, scene_name, media_dir)), encoding="utf-8")
+        sys.exit()
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--modules", nargs="+", default=MODULES)
+    parser.add_argument("--scenes", nargs="+", default=None, help="only these scene names")
+    parser.add_argument("--threshold", type=float, default=0.1, help="allowed fraction above the baseline")
+    parser.add_argument("--history", type=Path, default=HISTORY)
+    parser.add_argument("--baseline", type=Path, default=BASELINE)
+    parser.add_argument("--set-baseline", action="store_true", help="save this run as the baseline")
+    args = parser.parse_args()
+    entry = {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "commit": _commit(),
+        "settings": SETTINGS,
+        "results": run(args.modules, args.scenes),
+    }
+    with args.history.open("a", encoding="utf-8") as fp:
+        fp.write(json.dumps(entry) + "\n")
+    flagged = []
+    if args.baseline.exists() and not args.set_baseline:
+        flagged = regressions(entry["results"], json.loads(args.baseline.read_text(encoding="utf-8")), args.threshold)
+    else:
+        args.baseline.write_text(json.dumps(entry, indent=2), encoding="utf-8")
+        print(f"Baseline saved to {args.baseline}")
+    for line in flagged:
+        print(f"REGRESSION {line}")
+    sys.exit(1 if flagged else 0)
@@ -0,0 +1,72 @@
+"""
+terms_to_tolerance.py
+
+Benchmark of derivatives.terms_to_tolerance against the per-point loops it replaced in
+taylor_series.py (maclaurine_exp / taylor_exp). The loops compared f(x) against cos(4)
+and recomputed factorials each step. They are reproduced here with the target fixed to
+cos(x), so they terminate for every x.
+
+For every grid size, the loop runs on at most --loop-points points (it is timed per point)
+and the results are checked against the vectorized counts on those points.
+
+Usage: python benchmarks/terms_to_tolerance.py [--sizes 1000 100000 1000000] [--tol 0.001]
+
+Dependencies: Requires numpy and derivatives.
+
+"""
+
+from pathlib import Path
+import argparse
+import math as m
+import sys
+import time
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from derivatives import terms_to_tolerance
+
+
+def loop_terms(x, a, epsilon):
+    derivatives = [m.cos(a), -m.sin(a), -m.cos(a), m.sin(a)]
+    sum = 0
+    i = 0
+    while abs(sum - m.cos(x)) > epsilon:
+        sum += derivatives[i % 4] * (x - a)**i / m.factorial(i)
+        i += 1
+    return sum, i
+
+
+def timed(function, *args, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function(*args)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def run(sizes, tol, loop_points, x_range=(-10, 10)):
+    print(f"{'points':>10} {'center':>8} {'loop us/pt':>11} {'vector us/pt':>13} {'speedup':>8} {'max terms':>10}")
+    for size in sizes:
+        x = np.linspace(*x_range, size)
+        sample = x[:: max(1, size // loop_points)]
+        for a in (0.0, np.pi):
+            loop_time, loop_result = timed(lambda: [loop_terms(value, a, tol) for value in sample], repeat=1)
+            vector_time, (_, counts) = timed(terms_to_tolerance, "cos", x, a, tol)
+            _, sample_counts = terms_to_tolerance("cos", sample, a, tol)
+            assert [i for _, i in loop_result] == list(sample_counts), "term counts differ from the loop"
+            loop_per_point = 1e6 * loop_time / len(sample)
+            vector_per_point = 1e6 * vector_time / size
+            print(
+                f"{size:>10} {a:>8.4f} {loop_per_point:>11.3f} {vector_per_point:>13.4f}"
+                f" {loop_per_point / vector_per_point:>7.0f}x {counts.max():>10}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 100_000, 1_000_000])
+    parser.add_argument("--tol", type=float, default=0.001)
+    parser.add_argument("--loop-points", type=int, default=2_000)
+    args = parser.parse_args()
+    run(args.sizes, args.tol, args.loop_points)
@@ -0,0 +1,149 @@
+"""
+curve_morph.py
+
+A fast path for Transform between curves.
+
+Every expansion scene is driven by ReplacementTransform(graphs[i-1], graphs[i]). Manim
+aligns the two families once in begin, so that their point arrays correspond one to one
+(adaptive graphs with different sample counts get the same number of curves). But on
+every frame it then collects the families again and builds new arrays for the points
+and for every colour and width attribute of each curve.
+
+With enable_curve_morph, a straight-path Transform (and so ReplacementTransform) still
+aligns its families in begin, as Manim does. If the aligned members are all VMobjects
+whose arrays broadcast together, each frame then writes (1 - alpha) * start + alpha * end
+into buffers allocated in begin, which the mobject draws from. This is the formula Manim
+uses, with the same sub-alpha per member, so the frames are identical. Attributes that
+are the same at both ends (usually the colour and stroke width) are not touched.
+Anything else falls back to Manim's generic path. That includes arc paths, subclasses
+that change how members are interpolated and the OpenGL renderer.
+
+Classes:
+- CurveMorph: Start, end and output buffers for each attribute that changes, per curve.
+
+Functions:
+- matching_curves(mobject, target): (member, target member) pairs of aligned families if they can be lerped in place, else None.
+- enable_curve_morph(): Take the fast path in every following Transform it applies to.
+
+Dependencies: Requires Manim and numpy.
+
+"""
+
+import numpy as np
+from manim import *
+from manim.utils.bezier import interpolate
+
+# What VMobject.interpolate changes: the points, then the attributes of interpolate_color
+LERPED_ATTRS = [
+    "points", "fill_rgbas", "stroke_rgbas", "background_stroke_rgbas", "stroke_width",
+    "background_stroke_width", "sheen_direction", "sheen_factor",
+]
+
+stats = {"morphs": 0, "generic": 0}
+_settings = {"installed": False}
+_wrapped = {}
+
+
+def matching_curves(mobject, target):
+    """
+    Pairs of family members with points, as Transform zips them, if they are all VMobjects
+    and every lerped attribute broadcasts between them; None when Manim's path is needed.
+    Call it on families aligned with align_data.
+    """
+    pairs = list(zip(mobject.family_members_with_points(), target.family_members_with_points()))
+    for member, target_member in pairs:
+        if not (isinstance(member, VMobject) and isinstance(target_member, VMobject)):
+            return None
+        for attr in LERPED_ATTRS:
+            start, end = getattr(member, attr), getattr(target_member, attr)
+            if isinstance(start, np.ndarray) != isinstance(end, np.ndarray):
+                return None
+            try:
+                np.broadcast_shapes(np.shape(start), np.shape(end))
+            except ValueError:
+                return None
+    return pairs
+
+
+class CurveMorph:
+    """
+    parts holds, for every member with points, its array attributes that change as
+    (start, end, buffer, scratch) and its scalar ones as (attr, start, end). The member
+    draws from the buffers from begin on.
+    """
+
+    def __init__(self, pairs):
+        self.parts = []
+        for member, target in pairs:
+            arrays, scalars = [], []
+            for attr in LERPED_ATTRS:
+                start, end = getattr(member, attr), getattr(target, attr)
+                if not isinstance(start, np.ndarray):
+                    if start != end:
+                        scalars.append((attr, start, end))
+                elif start.shape != end.shape or not np.array_equal(start, end):
+                    shape = np.broadcast_shapes(start.shape, end.shape)
+                    buffer = np.empty(shape, dtype=np.result_type(start, end, float))
+                    arrays.append((start, end, buffer, np.empty_like(buffer)))
+                    setattr(member, attr, buffer)
+            self.parts.append((member, arrays, scalars))
+
+    def set_alpha(self, index, alpha):
+        member, arrays, scalars = self.parts[index]
+        for start, end, buffer, scratch in arrays:
+            if alpha == 1:
+                np.copyto(buffer, end)
+                continue
+            np.multiply(start, 1 - alpha, out=buffer)
+            np.multiply(end, alpha, out=scratch)
+            buffer += scratch
+        for attr, start, end in scalars:
+            setattr(member, attr, end if alpha == 1 else interpolate(start, end, alpha))
+
+
+def _uses_generic_path(animation):
+    cls = type(animation)
+    return (
+        config.renderer != RendererType.CAIRO
+        or animation.path_func is not interpolate
+        or cls.interpolate_submobject is not Transform.interpolate_submobject
+        or cls.get_all_mobjects is not Transform.get_all_mobjects
+        or cls.get_all_families_zipped is not Transform.get_all_families_zipped
+    )
+
+
+def _morph_begin(self):
+    self.curve_morph = None
+    if _uses_generic_path(self):
+        return _wrapped["begin"](self)
+    # Transform.begin, with buffers for the aligned families
+    self.target_mobject = self.create_target()
+    self.target_copy = self.target_mobject.copy()
+    self.mobject.align_data(self.target_copy)
+    pairs = matching_curves(self.mobject, self.target_copy)
+    if pairs is None:
+        stats["generic"] += 1
+    else:
+        stats["morphs"] += 1
+        self.curve_morph = CurveMorph(pairs)
+    Animation.begin(self)
+
+
+def _morph_interpolate_mobject(self, alpha):
+    morph = self.__dict__.get("curve_morph")
+    if morph is None:
+        return _wrapped["interpolate_mobject"](self, alpha)
+    # The same members, in the same order, as Manim's get_all_families_zipped
+    count = len(morph.parts)
+    for index in range(count):
+        morph.set_alpha(index, self.get_sub_alpha(alpha, index, count))
+
+
+def enable_curve_morph():
+    """Lerp in place every following straight-path Transform between VMobject families."""
+    if _settings["installed"]:
+        return
+    _settings["installed"] = True
+    _wrapped.update(begin=Transform.begin, interpolate_mobject=Transform.interpolate_mobject)
+    Transform.begin = _morph_begin
+    Transform.interpolate_mobject = _morph_interpolate_mobject
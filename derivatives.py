@@ -0,0 +1,278 @@
+"""
+derivatives.py
+
+Derivative oracle for the Taylor series scenes.
+
+derivative_table(f, order, a) returns [f(a), f'(a), ..., f^(order)(a)] stacked along the
+first axis in one NumPy call. `a` may be an array of expansion points, so a whole
+ValueTracker sweep can be tabulated at once. Known series (the names used by
+series_registry) use closed forms; any other callable written with NumPy functions is
+differentiated exactly with Taylor-mode automatic differentiation through Jet.
+
+Classes:
+- Jet: Truncated Taylor series c_0 + c_1 t + ... + c_N t^N with array-valued coefficients.
+
+Functions:
+- derivative_table(f, order, a): All derivatives of f at a up to `order`.
+- nth_derivative(f, n, a): The n-th derivative of f at a.
+- taylor_coefficients(f, order, a): f^(k)(a) / k! for k = 0..order, ready for taylor_engine.
+- terms_to_tolerance(f, x, a, tol, max_terms): Terms of the series at a needed to get within tol of f(x).
+
+Dependencies: Requires numpy and the standard library (math).
+
+"""
+
+import math as m
+import numpy as np
+
+
+def _factorials(order):
+    return np.array([float(m.factorial(k)) for k in range(order + 1)])
+
+
+def _along_first_axis(values, a):
+    return np.asarray(values, dtype=float).reshape((-1,) + (1,) * np.ndim(a))
+
+
+def _cycle(values, order):
+    # Derivatives that repeat with period len(values), e.g. cos -> -sin -> -cos -> sin
+    return np.stack(values)[np.arange(order + 1) % len(values)]
+
+
+def _reciprocal(s):
+    # d^n/dx^n 1/(1 + s x) = (-s)^n n! / (1 + s x)^(n+1)
+    def table(order, a):
+        scale = _along_first_axis([float((-s)**k * m.factorial(k)) for k in range(order + 1)], a)
+        return scale / (1.0 + s * a) ** _along_first_axis(np.arange(order + 1) + 1, a)
+    return table
+
+
+def _log1p(order, a):
+    table = np.empty((order + 1,) + np.shape(a))
+    table[0] = np.log1p(a)
+    if order > 0:
+        table[1:] = _reciprocal(1)(order - 1, a)
+    return table
+
+
+CLOSED_FORMS = {
+    "cos": lambda order, a: _cycle([np.cos(a), -np.sin(a), -np.cos(a), np.sin(a)], order),
+    "sin": lambda order, a: _cycle([np.sin(a), np.cos(a), -np.sin(a), -np.cos(a)], order),
+    "cosh": lambda order, a: _cycle([np.cosh(a), np.sinh(a)], order),
+    "sinh": lambda order, a: _cycle([np.sinh(a), np.cosh(a)], order),
+    "e^x": lambda order, a: _cycle([np.exp(a)], order),
+    "ln(1+x)": _log1p,
+    "1/(1-x)": _reciprocal(-1),
+    "1/(1+x)": _reciprocal(1),
+}
+
+NUMPY_FORMS = {
+    "tan": np.tan,
+    "arcsin": np.arcsin,
+    "arcsinh": np.arcsinh,
+    "arctanh": np.arctanh,
+    "e^{x^2}": lambda x: np.exp(x * x),
+}
+
+
+class Jet:
+    """
+    Truncated Taylor series in t with coefficients[k] of shape a.shape. Evaluating a
+    function on Jet.variable(a, order) (= a + t) yields its Taylor coefficients at a.
+    Supports + - * / ** (either side) and the NumPy ufuncs in UFUNCS; math module functions do not
+    accept jets.
+    """
+
+    def __init__(self, coefficients):
+        self.coefficients = coefficients
+
+    @classmethod
+    def variable(cls, a, order):
+        coefficients = np.zeros((order + 1,) + np.shape(a))
+        coefficients[0] = a
+        if order > 0:
+            coefficients[1] = 1.0
+        return cls(coefficients)
+
+    def _lift(self, other):
+        if isinstance(other, Jet):
+            return other
+        coefficients = np.zeros_like(self.coefficients)
+        coefficients[0] = other
+        return Jet(coefficients)
+
+    def __add__(self, other):
+        return Jet(self.coefficients + self._lift(other).coefficients)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        return Jet(self.coefficients - self._lift(other).coefficients)
+
+    def __rsub__(self, other):
+        return Jet(self._lift(other).coefficients - self.coefficients)
+
+    def __neg__(self):
+        return Jet(-self.coefficients)
+
+    def __mul__(self, other):
+        if not isinstance(other, Jet):
+            return Jet(self.coefficients * other)
+        u, v = self.coefficients, other.coefficients
+        w = np.empty_like(u)
+        for k in range(len(u)):
+            w[k] = np.sum(u[:k + 1] * v[k::-1], axis=0)
+        return Jet(w)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        if not isinstance(other, Jet):
+            return Jet(self.coefficients / other)
+        u, v = self.coefficients, other.coefficients
+        q = np.empty_like(u)
+        for k in range(len(u)):
+            q[k] = (u[k] - np.sum(q[:k] * v[k:0:-1], axis=0)) / v[0]
+        return Jet(q)
+
+    def __rtruediv__(self, other):
+        return self._lift(other) / self
+
+    def __pow__(self, p):
+        if float(p).is_integer() and p >= 0:
+            # Binary powering: exact wherever u_0 is, including 0
+            result, base, n = self._lift(1.0), self, int(p)
+            while n:
+                if n & 1:
+                    result = result * base
+                n >>= 1
+                if n:
+                    base = base * base
+            return result
+        # u v' = p u' v gives v_k = sum_{j=1..k} (p*j - (k-j)) u_j v_{k-j} / (k u_0),
+        # defined where u_0 != 0 (elsewhere u^p has no Taylor series in general)
+        u = self.coefficients
+        v = np.empty_like(u)
+        v[0] = u[0] ** p
+        with np.errstate(divide="ignore", invalid="ignore"):
+            for k in range(1, len(u)):
+                j = _along_first_axis(np.arange(1, k + 1), u[0])
+                v[k] = np.sum((p * j - (k - j)) * u[1:k + 1] * v[k - 1::-1], axis=0) / (k * u[0])
+        return Jet(v)
+
+    def __rpow__(self, base):
+        # base ** x = exp(x log(base))
+        return (self * np.log(base))._exp()
+
+    def _integrate(self, value, derivative):
+        # w = F(u) with F' = g: w_k = sum_{j=1..k} j u_j g_{k-j} / k
+        u, g = self.coefficients, derivative.coefficients
+        w = np.empty_like(u)
+        w[0] = value
+        for k in range(1, len(u)):
+            j = _along_first_axis(np.arange(1, k + 1), u[0])
+            w[k] = np.sum(j * u[1:k + 1] * g[k - 1::-1], axis=0) / k
+        return Jet(w)
+
+    def _exp(self):
+        u = self.coefficients
+        e = np.empty_like(u)
+        e[0] = np.exp(u[0])
+        for k in range(1, len(u)):
+            j = _along_first_axis(np.arange(1, k + 1), u[0])
+            e[k] = np.sum(j * u[1:k + 1] * e[k - 1::-1], axis=0) / k
+        return Jet(e)
+
+    def _sin_cos(self):
+        u = self.coefficients
+        s, c = np.empty_like(u), np.empty_like(u)
+        s[0], c[0] = np.sin(u[0]), np.cos(u[0])
+        for k in range(1, len(u)):
+            j = _along_first_axis(np.arange(1, k + 1), u[0])
+            s[k] = np.sum(j * u[1:k + 1] * c[k - 1::-1], axis=0) / k
+            c[k] = -np.sum(j * u[1:k + 1] * s[k - 1::-1], axis=0) / k
+        return Jet(s), Jet(c)
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        if method != "__call__" or ufunc not in UFUNCS or kwargs:
+            return NotImplemented
+        return UFUNCS[ufunc](*inputs)
+
+
+UFUNCS = {
+    np.add: lambda x, y: x + y if isinstance(x, Jet) else y + x,
+    np.subtract: lambda x, y: x - y if isinstance(x, Jet) else y.__rsub__(x),
+    np.multiply: lambda x, y: x * y if isinstance(x, Jet) else y * x,
+    np.true_divide: lambda x, y: x / y if isinstance(x, Jet) else y.__rtruediv__(x),
+    np.negative: lambda x: -x,
+    np.power: lambda x, p: x ** p if isinstance(x, Jet) else p.__rpow__(x),
+    np.square: lambda x: x * x,
+    np.sqrt: lambda x: x ** 0.5,
+    np.reciprocal: lambda x: 1.0 / x,
+    np.exp: lambda x: x._exp(),
+    np.log: lambda x: x._integrate(np.log(x.coefficients[0]), 1.0 / x),
+    np.log1p: lambda x: x._integrate(np.log1p(x.coefficients[0]), 1.0 / (1.0 + x)),
+    np.sin: lambda x: x._sin_cos()[0],
+    np.cos: lambda x: x._sin_cos()[1],
+    np.tan: lambda x: np.divide(*x._sin_cos()),
+    np.sinh: lambda x: (x._exp() - (-x)._exp()) * 0.5,
+    np.cosh: lambda x: (x._exp() + (-x)._exp()) * 0.5,
+    np.arctan: lambda x: x._integrate(np.arctan(x.coefficients[0]), 1.0 / (1.0 + x * x)),
+    np.arcsin: lambda x: x._integrate(np.arcsin(x.coefficients[0]), (1.0 - x * x) ** -0.5),
+    np.arcsinh: lambda x: x._integrate(np.arcsinh(x.coefficients[0]), (1.0 + x * x) ** -0.5),
+    np.arctanh: lambda x: x._integrate(np.arctanh(x.coefficients[0]), 1.0 / (1.0 - x * x)),
+}
+UFUNCS[np.divide] = UFUNCS[np.true_divide]
+
+
+def taylor_coefficients(f, order, a):
+    """f^(k)(a) / k! for k = 0..order along axis 0; `a` may be a scalar or an array."""
+    a = np.asarray(a, dtype=float)
+    if isinstance(f, str) and f in CLOSED_FORMS:
+        return CLOSED_FORMS[f](order, a) / _along_first_axis(_factorials(order), a)
+    result = NUMPY_FORMS.get(f, f)(Jet.variable(a, order))
+    if not isinstance(result, Jet):
+        # f did not depend on x
+        result = Jet.variable(a, order)._lift(result)
+    return result.coefficients
+
+
+def derivative_table(f, order, a):
+    """[f(a), f'(a), ..., f^(order)(a)] along axis 0; `a` may be a scalar or an array."""
+    a = np.asarray(a, dtype=float)
+    if isinstance(f, str) and f in CLOSED_FORMS:
+        return CLOSED_FORMS[f](order, a)
+    return taylor_coefficients(f, order, a) * _along_first_axis(_factorials(order), a)
+
+
+def nth_derivative(f, n, a):
+    return derivative_table(f, n, a)[n]
+
+
+def terms_to_tolerance(f, x, a=0.0, tol=1e-3, max_terms=100):
+    """
+    Number of terms n for which the Taylor polynomial of f about a first gets within tol of
+    f(x), and that partial sum; x and a broadcast against each other. Where the series does
+    not get there within max_terms terms, n is -1 and the sum is the max_terms partial sum.
+    Each term is built from the previous one's (x - a)^k / k!, so no factorial is formed,
+    and the derivative table is only evaluated at the distinct centers.
+    """
+    x, a = np.broadcast_arrays(np.asarray(x, dtype=float), np.asarray(a, dtype=float))
+    target = derivative_table(f, 0, x)[0]
+    centers, inverse = np.unique(a, return_inverse=True)
+    table = derivative_table(f, max_terms - 1, centers)
+
+    total = np.zeros(x.shape)
+    sums = np.zeros(x.shape)
+    counts = np.where(np.abs(target) <= tol, 0, -1)
+    power = np.ones(x.shape)
+    for k in range(max_terms):
+        if (counts >= 0).all():
+            break
+        if k > 0:
+            power *= (x - a) / k
+        total += table[k][inverse.reshape(x.shape)] * power
+        reached = (counts < 0) & (np.abs(total - target) <= tol)
+        counts[reached] = k + 1
+        sums[reached] = total[reached]
+    return np.where(counts < 0, total, sums), counts
@@ -0,0 +1,206 @@
+"""
+dirty_regions.py
+
+Redraw only the parts of a Cairo frame that changed since the previous frame.
+
+For every frame of a play, Manim copies the static image into the camera and strokes and
+fills every moving mobject again. In a play such as Write(tex[5]) in TaylorProofCos, or
+one step of Newton, that is every mobject added after the first animated one: earlier
+equations, the divider line, dots and tangents. Only one or two of them actually change
+from one frame to the next.
+
+DirtyRegions remembers, for the previous frame, a signature of what every displayed
+mobject looks like (its points and its fill, stroke and sheen styling) and its pixel
+bounding box, widened by the stroke. For the next frame it compares the signatures. The
+old and new boxes of the mobjects that changed are the dirty rectangles. Only these are
+reset to the static image, and only the mobjects overlapping them are drawn, with Cairo
+clipped to the rectangles. The rest of the camera's pixel array already holds the
+previous frame. A frame with no changes is not drawn at all.
+
+The whole frame is redrawn as before on the first frame after a new static image (each
+play makes one, from scratch or from a cache), after any draw outside the play loop,
+when the displayed mobjects or their order change, when the camera moves, when something
+other than a plain VMobject is on screen (images, background-image mobjects, 3D
+cameras), and when the dirty rectangles cover more than `max_fraction` of the frame.
+
+Classes:
+- DirtyRegions: What the last frame drew, per mobject, and where the next one differs.
+
+Functions:
+- enable_dirty_regions(max_fraction): Redraw only the changed regions of every following Cairo frame.
+
+Dependencies: Requires Manim and numpy.
+
+"""
+
+import math
+import numpy as np
+from manim import *
+from manim.renderer.cairo_renderer import CairoRenderer
+from manim.utils.iterables import list_update
+
+DRAWN_ATTRS = [
+    "points", "fill_rgbas", "stroke_rgbas", "background_stroke_rgbas", "stroke_width",
+    "background_stroke_width", "sheen_factor", "sheen_direction", "joint_type", "cap_style",
+]
+
+stats = {"partial": 0, "unchanged": 0, "full": 0}
+_settings = {"max_fraction": 0.5, "installed": False}
+_wrapped = {}
+
+
+def _signature(mobject):
+    parts = []
+    for attr in DRAWN_ATTRS:
+        value = getattr(mobject, attr, None)
+        parts.append(np.ascontiguousarray(value).tobytes() if isinstance(value, np.ndarray) else repr(value).encode())
+    return hash(b"\0".join(parts))
+
+
+def _pixel_box(camera, mobject):
+    """(left, top, right, bottom) pixels covered by mobject, clamped to the frame; None if unknown."""
+    points = mobject.points[:, :2]
+    if not np.all(np.isfinite(points)):
+        return None
+    # Room for the stroke, including Cairo's miter joins (up to 10 half-widths)
+    widths = [getattr(mobject, attr, 0) or 0 for attr in ("stroke_width", "background_stroke_width")]
+    margin = 5 * camera.cairo_line_width_multiple * max(widths)
+    (x0, y0), (x1, y1) = points.min(axis=0) - margin, points.max(axis=0) + margin
+    scale_x = camera.pixel_width / camera.frame_width
+    scale_y = camera.pixel_height / camera.frame_height
+    center_x, center_y = camera.frame_center[:2]
+    left = math.floor((x0 - center_x) * scale_x + camera.pixel_width / 2) - 2
+    right = math.ceil((x1 - center_x) * scale_x + camera.pixel_width / 2) + 2
+    top = math.floor(camera.pixel_height / 2 - (y1 - center_y) * scale_y) - 2
+    bottom = math.ceil(camera.pixel_height / 2 - (y0 - center_y) * scale_y) + 2
+    return (
+        min(max(left, 0), camera.pixel_width),
+        min(max(top, 0), camera.pixel_height),
+        min(max(right, 0), camera.pixel_width),
+        min(max(bottom, 0), camera.pixel_height),
+    )
+
+
+def _overlaps(box, rects):
+    left, top, right, bottom = box
+    return any(left < r_right and r_left < right and top < r_bottom and r_top < bottom for r_left, r_top, r_right, r_bottom in rects)
+
+
+def _drawable(camera, mobject):
+    return (
+        isinstance(mobject, VMobject)
+        and not mobject.get_background_image()
+        and type(camera).transform_points_pre_display is Camera.transform_points_pre_display
+    )
+
+
+class DirtyRegions:
+    """
+    entries maps id(mobject) to (signature, pixel box) for the last frame drawn; base
+    identifies what that frame was drawn on (camera frame, pixel array). A new static
+    image has to be reported with invalidate().
+    """
+
+    def __init__(self):
+        self.entries = {}
+        self.order = None
+        self.base = None
+
+    def invalidate(self):
+        self.base = None
+
+    def redraw(self, camera, mobjects, static_image, max_fraction=0.5):
+        """
+        Bring the camera's pixel array from the last frame to this one by redrawing the
+        changed regions, and return them (none if nothing changed). Returns None, with the
+        new state recorded, when the caller has to draw the whole frame instead.
+        """
+        display = camera.get_mobjects_to_display(mobjects)
+        base = (id(camera.pixel_array), tuple(camera.frame_center), camera.frame_width, camera.frame_height)
+        order = [id(mobject) for mobject in display]
+        partial = base == self.base and order == self.order and all(_drawable(camera, mobject) for mobject in display)
+        entries, rects = {}, []
+        for mobject in display:
+            signature = _signature(mobject)
+            previous = self.entries.get(id(mobject))
+            if previous is not None and previous[0] == signature:
+                entries[id(mobject)] = previous
+                continue
+            entries[id(mobject)] = (signature, _pixel_box(camera, mobject))
+            if previous is not None:
+                rects += [entries[id(mobject)][1], previous[1]]
+        self.entries, self.order, self.base = entries, order, base
+        if not partial or None in rects:
+            return None
+        rects = [rect for rect in rects if rect[2] > rect[0] and rect[3] > rect[1]]
+        if sum((right - left) * (bottom - top) for left, top, right, bottom in rects) > max_fraction * camera.pixel_width * camera.pixel_height:
+            return None
+        if rects:
+            self._draw_rects(camera, display, entries, rects, camera.background if static_image is None else static_image)
+        return rects
+
+    def _draw_rects(self, camera, display, entries, rects, background):
+        pixels = camera.pixel_array
+        for left, top, right, bottom in rects:
+            pixels[top:bottom, left:right] = background[top:bottom, left:right]
+        ctx = camera.get_cairo_context(pixels)
+        matrix = ctx.get_matrix()
+        ctx.save()
+        try:
+            ctx.identity_matrix()
+            ctx.new_path()
+            for left, top, right, bottom in rects:
+                ctx.rectangle(left, top, right - left, bottom - top)
+            ctx.clip()
+            ctx.set_matrix(matrix)
+            touched = [mobject for mobject in display if entries[id(mobject)][1] is not None and _overlaps(entries[id(mobject)][1], rects)]
+            camera.display_multiple_vectorized_mobjects(touched, pixels)
+        finally:
+            ctx.restore()
+
+
+def _render_frame(self, scene, time, moving_mobjects):
+    self.rendering_frame = True
+    try:
+        _wrapped["render"](self, scene, time, moving_mobjects)
+    finally:
+        self.rendering_frame = False
+
+
+def _dirty_static_frame_data(self, scene, static_mobjects):
+    # A new static image, even a cached one returned again, is a new base for the next frame
+    self.__dict__.setdefault("dirty_regions", DirtyRegions()).invalidate()
+    return _wrapped["save_static_frame_data"](self, scene, static_mobjects)
+
+
+def _dirty_update_frame(self, scene, mobjects=None, include_submobjects=True, ignore_skipping=True, **kwargs):
+    regions = self.__dict__.setdefault("dirty_regions", DirtyRegions())
+    if not getattr(self, "rendering_frame", False) or not include_submobjects or kwargs:
+        # Static images, frozen waits and last frames draw into the pixel array behind our back
+        regions.invalidate()
+    elif not (self.skip_animations and not ignore_skipping):
+        rects = regions.redraw(self.camera, mobjects or list_update(scene.mobjects, scene.foreground_mobjects), self.static_image, _settings["max_fraction"])
+        if rects is not None:
+            stats["partial" if rects else "unchanged"] += 1
+            return
+        stats["full"] += 1
+    return _wrapped["update_frame"](self, scene, mobjects, include_submobjects, ignore_skipping, **kwargs)
+
+
+def enable_dirty_regions(max_fraction=0.5):
+    """
+    Redraw only the changed regions of every following Cairo frame, or the whole frame
+    when they cover more than `max_fraction` of it.
+    """
+    _settings.update(max_fraction=max_fraction)
+    if not _settings["installed"]:
+        # Wraps whatever is installed now (frame_pipeline's render, axes_cache's static image)
+        _settings["installed"] = True
+        _wrapped.update(
+            render=CairoRenderer.render,
+            update_frame=CairoRenderer.update_frame,
+            save_static_frame_data=CairoRenderer.save_static_frame_data,
+        )
+        CairoRenderer.render = _render_frame
+        CairoRenderer.save_static_frame_data = _dirty_static_frame_data
+        CairoRenderer.update_frame = _dirty_update_frame
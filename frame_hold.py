@@ -0,0 +1,137 @@
+"""
+frame_hold.py
+
+Static waits encoded as one held frame.
+
+A self.wait() with nothing updating is a frozen frame: Manim draws the scene once and
+then pipes the same raw frame to ffmpeg duration * fps times, 120 copies of 8 MB for a
+wait(2) at 1080p60. Each copy is also converted to yuv420p and encoded. TaylorProofCos
+has about 20 such waits and Newton about 10. Before that, Manim rasterizes the static
+mobjects into a static image and then draws every mobject over it again, because the
+wait has no moving mobjects.
+
+With enable_frame_hold, a static wait:
+
+- skips the static image, which the frozen frame draws over anyway;
+- reuses the previous wait's pixels, without rasterizing, when the scene's content and
+  the camera are unchanged since then (consecutive waits, or a wait after plays, cached
+  or not, that left the scene as it was);
+- writes its frame to ffmpeg once. The encoder repeats it with a tpad filter, so
+  nothing is piped or converted again, and the repeats encode as skipped blocks. The
+  partial movie file has the same frame count, frame rate and codec settings as before,
+  so Manim still joins it to the others without re-encoding.
+
+Functions:
+- enable_frame_hold(): Hold the frame of every following static wait of a Cairo render.
+
+Dependencies: Requires Manim, ffmpeg and animation_cache.
+
+"""
+
+import subprocess
+from manim import *
+from manim import __version__
+from manim.renderer.cairo_renderer import CairoRenderer
+from manim.utils.file_ops import is_webm_format, write_to_movie
+from manim.utils.iterables import list_update
+from animation_cache import CAMERA_ATTRS, content_hash
+
+stats = {"held_waits": 0, "reused_frames": 0, "frames_not_piped": 0}
+_wrapped = {}
+
+
+def _compile_animation_data(self, *args, **kwargs):
+    result = _wrapped["compile_animation_data"](self, *args, **kwargs)
+    # Known here, before the renderer opens the partial movie file for this play
+    frames = None
+    if config.renderer == RendererType.CAIRO and write_to_movie() and self.is_current_animation_frozen_frame():
+        frames = int(self.duration / (1 / self.renderer.camera.frame_rate))
+    self.renderer.file_writer.pending_hold = frames if frames and frames > 1 else None
+    return result
+
+
+def _held_movie_command(file_path, frames):
+    # SceneFileWriter.open_movie_pipe's command for a Cairo render, with the first frame held
+    fps = config.frame_rate
+    if fps == int(fps):
+        fps = int(fps)
+    command = [
+        config.ffmpeg_executable, "-y", "-f", "rawvideo", "-s", f"{config.pixel_width}x{config.pixel_height}",
+        "-pix_fmt", "rgba", "-r", str(fps), "-i", "-", "-an", "-loglevel", config.ffmpeg_loglevel.lower(),
+        "-metadata", f"comment=Rendered with Manim Community v{__version__}",
+        "-vf", f"tpad=stop_mode=clone:stop={frames - 1}",
+    ]
+    if is_webm_format():
+        command += ["-vcodec", "libvpx-vp9", "-auto-alt-ref", "0"]
+    elif config.transparent:
+        command += ["-vcodec", "qtrle"]
+    else:
+        command += ["-vcodec", "libx264", "-pix_fmt", "yuv420p"]
+    return command + [file_path]
+
+
+def _open_movie_pipe(self, file_path=None):
+    frames = self.__dict__.pop("pending_hold", None)
+    if frames is None:
+        return _wrapped["open_movie_pipe"](self, file_path)
+    if file_path is None:
+        file_path = self.partial_movie_files[self.renderer.num_plays]
+    self.partial_movie_file_path = file_path
+    # The one frame is written straight to the pipe, by SceneFileWriter.write_frame
+    self.writing_process = subprocess.Popen(_held_movie_command(file_path, frames), stdin=subprocess.PIPE)
+    self.held_frames = frames
+
+
+def _save_static_frame_data(self, scene, static_mobjects):
+    if not scene.is_current_animation_frozen_frame():
+        # The held frame stays valid across plays: the key below tells whether they changed anything
+        return _wrapped["save_static_frame_data"](self, scene, static_mobjects)
+    if scene.moving_mobjects:
+        # Foreground mobjects are redrawn over the static image
+        _wrapped["save_static_frame_data"](self, scene, static_mobjects)
+    else:
+        # With nothing moving, the frozen frame draws every mobject over the static image anyway
+        self.static_image = None
+    key = content_hash([getattr(self.camera, attr, None) for attr in CAMERA_ATTRS], list_update(scene.mobjects, scene.foreground_mobjects))
+    self.reuse_held_frame = key == self.__dict__.get("held_key") and self.__dict__.get("held_frame") is not None
+    self.held_key = key
+    return self.static_image
+
+
+def _update_frame(self, *args, **kwargs):
+    if self.__dict__.pop("reuse_held_frame", False):
+        stats["reused_frames"] += 1
+        self.camera.set_frame_to_background(self.held_frame)
+        return
+    return _wrapped["update_frame"](self, *args, **kwargs)
+
+
+def _freeze_current_frame(self, duration):
+    frame = self.held_frame = self.get_frame()
+    frames = self.file_writer.__dict__.pop("held_frames", None)
+    if frames is None:
+        return _wrapped["freeze_current_frame"](self, duration)
+    stats["held_waits"] += 1
+    stats["frames_not_piped"] += frames - 1
+    # add_frame advances the renderer's clock by one frame; the encoder adds the other ones
+    self.time += (frames - 1) / self.camera.frame_rate
+    self.add_frame(frame)
+
+
+def enable_frame_hold():
+    """Encode every following static wait of a Cairo render as one frame held by ffmpeg."""
+    if _wrapped:
+        return
+    # Wraps whatever is installed now (frame_pipeline, axes_cache, dirty_regions)
+    _wrapped.update(
+        compile_animation_data=Scene.compile_animation_data,
+        open_movie_pipe=SceneFileWriter.open_movie_pipe,
+        save_static_frame_data=CairoRenderer.save_static_frame_data,
+        update_frame=CairoRenderer.update_frame,
+        freeze_current_frame=CairoRenderer.freeze_current_frame,
+    )
+    Scene.compile_animation_data = _compile_animation_data
+    SceneFileWriter.open_movie_pipe = _open_movie_pipe
+    CairoRenderer.save_static_frame_data = _save_static_frame_data
+    CairoRenderer.update_frame = _update_frame
+    CairoRenderer.freeze_current_frame = _freeze_current_frame
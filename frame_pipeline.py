@@ -0,0 +1,157 @@
+"""
+frame_pipeline.py
+
+Streams Cairo frames to ffmpeg from a background thread, through a bounded pool of
+reusable RGBA buffers.
+
+For every frame, Manim's Cairo path copies the camera's pixel array (get_frame), copies it
+again into bytes (tobytes) and writes those bytes to ffmpeg's stdin on the main thread.
+Rasterizing stops whenever the pipe is full. At 1080p60 that is two 8 MB allocations per
+frame and an encoder stall for every frame of a long scene such as TaylorSeriesExpansion.
+
+With the pipeline enabled, each frame is copied once from the pixel array into a free
+buffer of a fixed-size pool and handed to a writer thread, which writes it to the pipe and
+returns the buffer to the pool. Frame N+1 is then rasterized while frame N is written and
+encoded. When every buffer is in flight the main thread waits for one, so memory stays
+at `buffers` frames however long the scene runs.
+
+Rasterizing frame N+1 needs the mobjects as frame N left them, so frames of one play are
+still drawn one after another. For several plays in parallel, see
+render_tools.render_parallel.
+
+Classes:
+- FramePool: A bounded set of preallocated frame buffers.
+- FrameWriter: Writer thread feeding one ffmpeg pipe from a FramePool.
+
+Functions:
+- enable_frame_pipeline(buffers): Route every following Cairo movie frame through a FrameWriter.
+
+Dependencies: Requires Manim and numpy.
+
+"""
+
+import queue
+import threading
+import numpy as np
+from manim import *
+from manim.renderer.cairo_renderer import CairoRenderer
+
+
+class FramePool:
+    """Up to `size` frame buffers, allocated on first use and then reused."""
+
+    def __init__(self, size=4):
+        self.size = size
+        self.allocated = 0
+        self._free = queue.Queue()
+
+    def acquire(self, frame):
+        """A buffer shaped like frame; blocks while all of them are in flight."""
+        if self._free.empty() and self.allocated < self.size:
+            self.allocated += 1
+            return np.empty_like(frame)
+        buffer = self._free.get()
+        if buffer.shape != frame.shape or buffer.dtype != frame.dtype:
+            buffer = np.empty_like(frame)
+        return buffer
+
+    def release(self, buffer):
+        self._free.put(buffer)
+
+
+class FrameWriter:
+    """Copies frames into pool buffers and writes them to `stream` from a background thread."""
+
+    def __init__(self, stream, pool):
+        self.stream = stream
+        self.pool = pool
+        self.error = None
+        self._filled = queue.Queue()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while True:
+            buffer = self._filled.get()
+            if buffer is None:
+                return
+            try:
+                if self.error is None:
+                    self.stream.write(memoryview(buffer).cast("B"))
+            except BaseException as error:
+                # Reported on the main thread by the next put or close; keep draining so it never blocks
+                self.error = error
+            finally:
+                self.pool.release(buffer)
+
+    def _raise_error(self):
+        if self.error is not None:
+            raise self.error
+
+    def put(self, frame):
+        self._raise_error()
+        buffer = self.pool.acquire(frame)
+        np.copyto(buffer, frame)
+        self._filled.put(buffer)
+
+    def close(self):
+        """Wait until every queued frame is written."""
+        self._filled.put(None)
+        self._thread.join()
+        self._raise_error()
+
+
+_settings = {"buffers": 4, "installed": False}
+_wrapped = {}
+
+
+def _piped_open_movie_pipe(self, file_path=None):
+    _wrapped["open_movie_pipe"](self, file_path)
+    if config.renderer == RendererType.CAIRO:
+        if not hasattr(self, "frame_pool"):
+            self.frame_pool = FramePool(_settings["buffers"])
+        self.frame_writer = FrameWriter(self.writing_process.stdin, self.frame_pool)
+
+
+def _piped_close_movie_pipe(self):
+    writer = getattr(self, "frame_writer", None)
+    self.frame_writer = None
+    try:
+        if writer is not None:
+            writer.close()
+    finally:
+        # Close and wait for ffmpeg even when the writer re-raises a pipe error
+        _wrapped["close_movie_pipe"](self)
+
+
+def _piped_write_frame(self, frame_or_renderer):
+    writer = getattr(self, "frame_writer", None)
+    if writer is None:
+        return _wrapped["write_frame"](self, frame_or_renderer)
+    writer.put(frame_or_renderer)
+
+
+def _render(self, scene, time, moving_mobjects):
+    # The writer copies the frame into its own buffer, so get_frame's copy is not needed
+    self.update_frame(scene, moving_mobjects)
+    self.add_frame(self.camera.pixel_array)
+
+
+def enable_frame_pipeline(buffers=4):
+    """
+    Send the frames of every following Cairo render through a FrameWriter on a pool of
+    `buffers` frames. OpenGL renders and image sequences keep Manim's own path.
+    """
+    _settings.update(buffers=buffers)
+    if not _settings["installed"]:
+        # Wraps whatever is installed now; calling it again only changes the settings
+        _settings["installed"] = True
+        _wrapped.update(
+            open_movie_pipe=SceneFileWriter.open_movie_pipe,
+            close_movie_pipe=SceneFileWriter.close_movie_pipe,
+            write_frame=SceneFileWriter.write_frame,
+        )
+        SceneFileWriter.open_movie_pipe = _piped_open_movie_pipe
+        SceneFileWriter.close_movie_pipe = _piped_close_movie_pipe
+        SceneFileWriter.write_frame = _piped_write_frame
+        CairoRenderer.render = _render
@@ -0,0 +1,67 @@
+"""
+glyph_atlas.py
+
+Numeric Tex labels assembled from glyphs compiled once.
+
+always_redraw(lambda: Tex(f"a = {round(k.get_value(), 2)}")) builds a new Tex on every
+frame, and every value the label has not shown before means another latex and dvisvgm
+run. GlyphAtlas typesets the prefix and each glyph of a number once, and
+GlyphAtlas.label(value) positions copies of those glyphs, so sweeping the tracker costs
+no compilation and no SVG parsing.
+
+The atlas typesets every glyph twice in a row ("a = 0{}0{}1{}1{}...-{}-{}"). The empty
+groups keep TeX from forming ligatures between neighbouring glyphs, such as the en-dash
+that "--" would give in text mode. The distance between the two copies of a glyph is its
+advance width, and the first copy's position gives its offset from the pen. A label is
+therefore laid out exactly as TeX would set the same string, because there are no kerns
+between digits, "." and "-", and a number never has two "-" in a row.
+
+Classes:
+- GlyphAtlas: Prefix and digit glyphs of one Tex style, assembled into number labels.
+
+Dependencies: Requires Manim.
+
+"""
+
+from manim import *
+
+
+class GlyphAtlas:
+    """
+    label(value) returns a VGroup looking like Tex(f"{prefix}{value}", **tex_kwargs) at its
+    unscaled size, so it can be positioned and scaled like that Tex. Values with characters
+    outside `glyphs` (e.g. "1e-05") fall back to a real Tex.
+    """
+
+    def __init__(self, prefix="", glyphs="0123456789.-", **tex_kwargs):
+        self.prefix = prefix
+        self.tex_kwargs = tex_kwargs
+        # "-{}" and "-{}" rather than "-" and "-", which TeX would set as one en-dash
+        doubled = [glyph + "{}" for glyph in glyphs for _ in range(2)]
+        atlas = Tex(*([prefix] if prefix else []), *doubled, **tex_kwargs)
+        self.prefix_mob = atlas[0] if prefix else VGroup()
+        start = 1 if prefix else 0
+
+        self.glyphs = {}
+        self.advances = {}
+        self.offsets = {}
+        pen = 0.0
+        for i, glyph in enumerate(glyphs):
+            first, second = atlas[start + 2 * i], atlas[start + 2 * i + 1]
+            self.glyphs[glyph] = first
+            self.advances[glyph] = second.get_left()[0] - first.get_left()[0]
+            self.offsets[glyph] = first.get_left()[0] - pen
+            pen += 2 * self.advances[glyph]
+
+    def label(self, value):
+        text = str(value)
+        if not set(text) <= self.glyphs.keys():
+            return Tex(f"{self.prefix}{text}", **self.tex_kwargs)
+        label = VGroup(self.prefix_mob.copy())
+        pen = 0.0
+        for char in text:
+            glyph = self.glyphs[char].copy()
+            glyph.shift((self.offsets[char] + pen - glyph.get_left()[0]) * RIGHT)
+            label.add(glyph)
+            pen += self.advances[char]
+        return label
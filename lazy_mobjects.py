@@ -0,0 +1,96 @@
+"""
+lazy_mobjects.py
+
+Deferred construction of mobjects that are only needed later in a scene.
+
+A construct() that builds every MathTex and graph before its first play pays for all the
+LaTeX runs, SVG parsing and plot sampling before the first frame, and keeps every
+mobject alive for the whole scene. LazyMobjects holds factories instead and builds each
+mobject the first time it is looked up, which in a scene is the play or add that first
+uses it. With `prefetch`, each lookup also queues the next few factories, in declaration
+order, on a background thread. Their LaTeX subprocesses then run while the current
+animation renders. Declare the factories in the order the scene uses them, or the thread
+builds what is needed last while the next mobject is built on the main thread.
+
+A factory runs at first use, or earlier on the prefetch thread, rather than where it is
+declared. It must therefore only read state that does not change in between and is not
+being animated: absolute positions, axes, or mobjects that no earlier play transforms.
+
+Classes:
+- LazyMobjects: Named factories, built on first lookup and memoized.
+- LazyList: A sequence of n mobjects built by factory(i) on first access.
+
+Dependencies: Requires the standard library (concurrent.futures, threading).
+
+"""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+import threading
+
+
+class LazyMobjects:
+    """
+    lazy["series1"] = lambda: MathTex(...) declares a mobject; lazy["series1"] builds it
+    (once) and returns it.
+    """
+
+    def __init__(self, prefetch=0):
+        self.prefetch = prefetch
+        self._factories = {}
+        self._futures = {}
+        self._lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(max_workers=1) if prefetch else None
+
+    def __setitem__(self, key, factory):
+        self._factories[key] = factory
+
+    def __contains__(self, key):
+        return key in self._factories
+
+    def _claim(self, key):
+        # The caller that creates the future is the one that builds it
+        with self._lock:
+            if key in self._futures:
+                return self._futures[key], False
+            future = self._futures[key] = Future()
+            return future, True
+
+    def _build(self, key):
+        future, owner = self._claim(key)
+        if owner:
+            try:
+                future.set_result(self._factories[key]())
+            except BaseException as error:
+                future.set_exception(error)
+        return future
+
+    def __getitem__(self, key):
+        future = self._build(key)
+        if self._pool is not None:
+            pending = [k for k in self._factories if k not in self._futures]
+            for next_key in pending[:self.prefetch]:
+                self._pool.submit(self._build, next_key)
+        return future.result()
+
+
+class LazyList(LazyMobjects):
+    """graphs = LazyList(lambda i: ..., 10) can replace a list of 10 eagerly built mobjects."""
+
+    def __init__(self, factory, length, prefetch=0):
+        super().__init__(prefetch)
+        self.length = length
+        for i in range(length):
+            self[i] = lambda i=i: factory(i)
+
+    def __len__(self):
+        return self.length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self.length))]
+        if not -self.length <= index < self.length:
+            raise IndexError(index)
+        return super().__getitem__(index % self.length)
+
+    def __iter__(self):
+        return (self[i] for i in range(self.length))
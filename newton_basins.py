@@ -0,0 +1,93 @@
+"""
+newton_basins.py
+
+Basin-of-attraction rasters of Newton's method for polynomials.
+
+Every pixel of a grid of starting values is iterated at once with NumPy, colored by the
+root it reaches and darkened by the number of steps that took, and written into an
+RGBA buffer that Manim shows as one ImageMobject. A grid of a few million pixels is
+not a few million Dots. The rows are split into chunks evaluated in a process pool, and
+within a chunk the points that have converged are dropped from the working set, so
+late iterations only touch the slow pixels.
+
+A polynomial is given by its coefficients, highest degree first (numpy.polyval
+order), which keeps the work picklable for the pool. A real polynomial over a one-row
+grid gives the 1D strip of starting points on the x-axis; a complex grid gives the
+familiar z^3 - 1 fractal.
+
+Functions:
+- basin_rows(coeffs, x, y, iterations, tol): Root index and step count for the grid x + iy.
+- shade(root_index, counts, colors, iterations): RGBA pixels for a basin_rows result.
+- basin_pixels(coeffs, x_range, y_range, width, height, colors, ...): Full raster, computed in chunks over a process pool.
+
+Dependencies: Requires numpy.
+
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+import os
+import numpy as np
+
+
+def basin_rows(coeffs, x, y, iterations=40, tol=1e-9):
+    """
+    Index (into np.roots(coeffs)) of the root each start x + iy converges to, -1 if it
+    does not within `iterations` steps, and the number of steps taken.
+    """
+    coeffs = np.asarray(coeffs)
+    dcoeffs = np.polyder(coeffs)
+    roots = np.roots(coeffs)
+    z = (x[None, :] + 1j * y[:, None]).ravel()
+    counts = np.full(z.shape, iterations, dtype=np.uint16)
+    active = np.arange(z.size)
+    with np.errstate(all="ignore"):
+        for n in range(1, iterations + 1):
+            w = z[active]
+            step = np.polyval(coeffs, w) / np.polyval(dcoeffs, w)
+            z[active] = w - step
+            # A nan step (zero derivative) also leaves the working set, and later fails the root test
+            done = ~(np.abs(step) > tol)
+            counts[active[done]] = n
+            active = active[~done]
+            if not active.size:
+                break
+        distances = np.abs(z[:, None] - roots[None, :])
+        root_index = np.argmin(distances, axis=1)
+        root_index = np.where(distances[np.arange(z.size), root_index] < 1e-6, root_index, -1)
+    shape = (len(y), len(x))
+    return root_index.reshape(shape), counts.reshape(shape)
+
+
+def shade(root_index, counts, colors, iterations=40):
+    """colors[i] (RGB floats in [0, 1]) for root i, darker the more steps it took; black if none."""
+    colors = np.asarray(colors, dtype=float)
+    brightness = 1 - 0.75 * np.minimum(counts, iterations) / iterations
+    rgb = colors[np.maximum(root_index, 0)] * brightness[..., None]
+    rgb[root_index < 0] = 0
+    pixels = np.empty(root_index.shape + (4,), dtype=np.uint8)
+    pixels[..., :3] = np.round(255 * rgb)
+    pixels[..., 3] = 255
+    return pixels
+
+
+def _chunk_pixels(coeffs, x, y, colors, iterations, tol):
+    return shade(*basin_rows(coeffs, x, y, iterations, tol), colors, iterations)
+
+
+def basin_pixels(coeffs, x_range, y_range, width, height, colors, iterations=40, tol=1e-9, processes=None, rows_per_chunk=32):
+    """
+    (height, width, 4) uint8 raster of the starts x_range[0]..x_range[1] (left to right)
+    by y_range[1]..y_range[0] (top to bottom), ready for ImageMobject. Chunks of
+    `rows_per_chunk` rows are evaluated on `processes` workers (default: one per core).
+    """
+    x = np.linspace(*x_range, width)
+    y = np.linspace(y_range[1], y_range[0], height)
+    pixels = np.empty((height, width, 4), dtype=np.uint8)
+    starts = range(0, height, rows_per_chunk)
+    chunks = [y[start:start + rows_per_chunk] for start in starts]
+    count = len(chunks)
+    with ProcessPoolExecutor(max_workers=min(processes or os.cpu_count(), count)) as pool:
+        results = pool.map(_chunk_pixels, [coeffs] * count, [x] * count, chunks, [colors] * count, [iterations] * count, [tol] * count)
+        for start, chunk in zip(starts, results):
+            pixels[start:start + len(chunk)] = chunk
+    return pixels
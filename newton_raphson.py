@@ -11,30 +11,69 @@ Classes:
     - Newton: A Manim scene that illustrates the Newton-Raphson method.
     - YThumbnail1: A Manim scene designed for creating a YouTube thumbnail.
     - Sqrt:
+    - NewtonBasins: Basins of attraction of Newton's method for z^3 - 1 over the complex plane.
+    - NewtonStrip: The same coloring for real starting points of f(x) = 0.3x^2 - 2.
+
+Functions:
+    - iteration_marks: Dots, tangents and dashed lines for every iterate of a Newton run.
 
 Description:
     The Newton-Raphson method is an iterative process to find successively better 
     approximations to the roots (or zeroes) of a real-valued function. This script 
     visually explains how the method works using an animation created with Manim.
+    The iterates come from one newton_solver.newton run per scene, and partial movie
+    files are cached by content (animation_cache).
 """
 
 from manim import *
+from newton_solver import newton
+from newton_basins import basin_pixels
+from axes_cache import background, shared_axes
+from render_tools import enable_render_stack
+
+enable_render_stack()
+
+
+ITERATION_COLORS = [GREEN, ORANGE, TEAL, PURPLE, MAROON]
+
+
+def iteration_marks(ax, curve, history, colors=ITERATION_COLORS):
+    """
+    (dot on the x-axis, dot on the curve, tangent, dashed line between the dots) for every
+    iterate of a newton() history that has a next one, and the x-axis dot of the last
+    iterate. Tangent n is colored colors[n], cycling; the first one is drawn longer.
+    """
+    steps = []
+    for n in range(len(history.x) - 1):
+        x = history.x[n]
+        axis_dot = Dot().move_to(ax.c2p(x, 0))
+        curve_dot = Dot().move_to(ax.c2p(x, curve.underlying_function(x)))
+        tangent = ax.get_secant_slope_group(
+            x=x, graph=curve, dx=0.01, secant_line_color=colors[n % len(colors)], secant_line_length=10 if n == 0 else 5
+        )
+        line = DashedLine(start=ax.c2p(x, 0), end=ax.c2p(x, curve.underlying_function(x)))
+        steps.append((axis_dot, curve_dot, tangent, line))
+    return steps, Dot().move_to(ax.c2p(history.x[-1], 0))
+
 
 #Graphical Visualisation
 class Newton(Scene):
+    # Newton steps drawn from x0; the first one is derived on screen
+    iterations = 2
+    x0 = 4.3
+
     def construct(self):
-        x0 = 4.3
         a = 2  # The 'a' value in the function f(x) = 0.3x^2 - a
-        ax = Axes(x_range=(-1, 6), y_range=(-3, 3), axis_config={"include_tip": False})
+        history = newton(lambda x: 0.3 * x**2 - a, self.x0, lambda x: 0.6 * x, iterations=self.iterations)
+        ax = shared_axes(x_range=(-1, 6), y_range=(-3, 3), axis_config={"include_tip": False})
         curve = ax.plot(lambda x: 0.3 * x**2 - a, color=BLUE)
-        labels = ax.get_axis_labels(x_label="x", y_label="f(x)=x^2-a")
+        labels = background(ax.get_axis_labels(x_label="x", y_label="f(x)=x^2-a"))
         VGroup(ax, curve, labels).shift(3 * LEFT + DOWN).scale(0.8)
         self.play(Create(VGroup(ax, curve, labels)))
 
-        dot1 = Dot().move_to(ax.c2p(x0, 0))
-        dot2 = Dot().move_to(ax.c2p(x0, curve.underlying_function(x0)))
-        tangent = ax.get_secant_slope_group(x=x0, graph=curve, dx=0.01, secant_line_color=GREEN)
-        line = DashedLine(start=ax.c2p(x0, 0), end=ax.c2p(x0, curve.underlying_function(x0)))
+        steps, last_dot = iteration_marks(ax, curve, history)
+        axis_dots = [step[0] for step in steps] + [last_dot]
+        dot1, dot2, tangent, line = steps[0]
         self.play(Create(VGroup(dot1, dot2, line, tangent)))
         self.play(
             Write(MathTex("x_0").scale(0.8).next_to(dot1, DOWN)),
@@ -42,11 +81,7 @@ class Newton(Scene):
         )
 
         # Newton-Raphson iteration
-        x1 = x0 - (0.3 * x0**2 - a) / (0.6 * x0)
-        dot3 = Dot().move_to(ax.c2p(x1, 0))
-        dot4 = Dot().move_to(ax.c2p(x1, curve.underlying_function(x1)))
-        tangent1 = ax.get_secant_slope_group(x=x1, graph=curve, dx=0.01, secant_line_color=ORANGE, secant_line_length=5)
-        line1 = DashedLine(start=ax.c2p(x1, 0), end=ax.c2p(x1, curve.underlying_function(x1)))
+        dot3 = axis_dots[1]
         self.play(Write(MathTex("x_1").scale(0.8).next_to(dot3, DOWN)), Write(dot3))
         self.wait(2)
 
@@ -71,15 +106,18 @@ class Newton(Scene):
         self.wait()
         self.play(Create(SurroundingRectangle(tex4)))
         self.wait()
-        self.play(Create(VGroup(dot3, line1, dot4, tangent1)))
 
-        x2 = x1 - (0.3 * x1**2 - a) / (0.6 * x1)
-        dot5 = Dot().move_to(ax.c2p(x2, 0))
-        self.play(Create(dot5))
-        tex5 = MathTex("x_2 = \\frac{1}{2}(x_1 + \\frac{a}{x_1})").scale(0.8).next_to(tex4, DOWN)
+        # Every further step from the same history
+        for n in range(1, len(steps)):
+            _, curve_dot, tangent_n, line_n = steps[n]
+            self.play(Create(VGroup(axis_dots[n], line_n, curve_dot, tangent_n)))
+            self.play(Create(axis_dots[n + 1]))
+            self.play(Write(MathTex(f"x_{{{n + 1}}}").scale(0.8).next_to(axis_dots[n + 1], DOWN)))
+
+        n = len(steps)
+        tex5 = MathTex(f"x_{{{n}}} = \\frac{{1}}{{2}}(x_{{{n - 1}}} + \\frac{{a}}{{x_{{{n - 1}}}}})").scale(0.8).next_to(tex4, DOWN)
         tex6 = MathTex("x_{n+1} = \\frac{1}{2}(x_n + \\frac{a}{x_n})").scale(0.8).next_to(tex5, DOWN, buff=1.2)
         dotted = DashedLine(start=tex5.get_bottom(), end=tex6.get_top())
-        self.play(Write(MathTex("x_2").scale(0.8).next_to(dot5, DOWN)))
         self.play(Write(tex5))
         self.play(Create(dotted))
         self.play(Write(tex6))
@@ -112,43 +150,75 @@ class Sqrt(Scene):
 
 #Video Thumbnail
 class YThumbnail(Scene):
+    # Overridden per variant by render_tools.render_stills
+    titles = ("How do Computers Compute", "Square Roots?")
+    curve_color = PINK
+    x0 = 4.3
+    iterations = 2
+    variants = [
+        {},
+        {"name": "YThumbnailBlue", "curve_color": BLUE},
+        {"name": "YThumbnailX0", "x0": 3.6},
+    ]
+
     def construct(self):
         # Titles
-        title3 = Text("How do Computers Compute", gradient=[TEAL, GREEN]).move_to(3.2 * UP).scale(1.5)
-        title2 = Text("Square Roots?", gradient=[GREEN, TEAL]).next_to(title3, DOWN, buff=0.5).scale(1.5)
+        title3 = Text(self.titles[0], gradient=[TEAL, GREEN]).move_to(3.2 * UP).scale(1.5)
+        title2 = Text(self.titles[1], gradient=[GREEN, TEAL]).next_to(title3, DOWN, buff=0.5).scale(1.5)
         method = Tex("Newton-Raphson Method").move_to(3.1 * DOWN).scale(2)
         
         # Axes and curve
-        ax = Axes(x_range=(-1, 5), y_range=(-3, 3), axis_config={"include_tip": False})
-        curve = ax.plot(lambda x: 0.3 * x**2 - 2, color=PINK)
+        ax = shared_axes(x_range=(-1, 5), y_range=(-3, 3), axis_config={"include_tip": False})
+        curve = ax.plot(lambda x: 0.3 * x**2 - 2, color=self.curve_color)
         VGroup(ax, curve).shift(3 * LEFT + 2 * DOWN).scale(0.8)
         self.add(ax, curve, title3, title2, method)
         
-        # Initial points and lines
-        x0 = 4.3
-        dot1 = Dot().move_to(ax.c2p(x0, 0))
-        dot2 = Dot().move_to(ax.c2p(x0, curve.underlying_function(x0)))
-        tangent = ax.get_secant_slope_group(x=x0, graph=curve, dx=0.01, secant_line_color=GREEN)
-        line = DashedLine(start=ax.c2p(x0, 0), end=ax.c2p(x0, curve.underlying_function(x0)))
-        self.add(dot1, dot2, line, tangent)
-        self.add(MathTex("x_0").scale(0.8).next_to(dot1, DOWN))
-        
-        # First iteration
-        x1 = x0 - (0.3 * x0**2 - 2) / (0.6 * x0)
-        dot3 = Dot().move_to(ax.c2p(x1, 0))
-        dot4 = Dot().move_to(ax.c2p(x1, curve.underlying_function(x1)))
-        tangent1 = ax.get_secant_slope_group(x=x1, graph=curve, dx=0.01, secant_line_color=ORANGE, secant_line_length=5)
-        line1 = DashedLine(start=ax.c2p(x1, 0), end=ax.c2p(x1, curve.underlying_function(x1)))
-        self.add(MathTex("x_1").scale(0.8).next_to(dot3, DOWN), dot3)
-        self.add(dot3, line1, dot4, tangent1)
-        
-        # Second iteration
-        x2 = x1 - (0.3 * x1**2 - 2) / (0.6 * x1)
-        dot5 = Dot().move_to(ax.c2p(x2, 0))
-        self.add(MathTex("x_2").scale(0.8).next_to(dot5, DOWN), dot5)
+        # Points and lines of every iteration
+        history = newton(lambda x: 0.3 * x**2 - 2, self.x0, lambda x: 0.6 * x, iterations=self.iterations)
+        steps, dot5 = iteration_marks(ax, curve, history)
+        for n, (axis_dot, curve_dot, tangent, line) in enumerate(steps):
+            self.add(axis_dot, curve_dot, line, tangent, MathTex(f"x_{{{n}}}").scale(0.8).next_to(axis_dot, DOWN))
+        self.add(MathTex(f"x_{{{len(steps)}}}").scale(0.8).next_to(dot5, DOWN), dot5)
         
         # Final text and arrow
         tex = MathTex("x_{n+1} = \\frac{1}{2}(x_n + \\frac{a}{x_n})").shift(4.3 * RIGHT)
         tex1 = Tex("sqrt()??").scale(1.5).move_to(3 * LEFT)
         arrow = Arrow(start=dot5.get_top(), end=tex1.get_bottom(), color=YELLOW_E)
-        self.add(tex, tex1, arrow, SurroundingRectangle(tex))      
\ No newline at end of file
+        self.add(tex, tex1, arrow, SurroundingRectangle(tex))      
+
+
+#Basins of attraction, one pixel per starting value
+class NewtonBasins(Scene):
+    def construct(self):
+        plane = ComplexPlane(
+            x_range=(-2 * config.frame_width / config.frame_height, 2 * config.frame_width / config.frame_height),
+            y_range=(-2, 2),
+            x_length=config.frame_width,
+            y_length=config.frame_height,
+        )
+        roots = np.roots([1, 0, 0, -1])
+        colors = [color_to_rgb(c) for c in (BLUE, PINK, YELLOW_E)]
+        pixels = basin_pixels([1, 0, 0, -1], plane.x_range[:2], plane.y_range[:2], config.pixel_width, config.pixel_height, colors)
+        image = ImageMobject(pixels).stretch_to_fit_width(plane.width).stretch_to_fit_height(plane.height).move_to(plane)
+        dots = VGroup(*[Dot(plane.n2p(root), color=WHITE) for root in roots])
+        title = MathTex("z^3 - 1 = 0").to_corner(UL).add_background_rectangle()
+
+        self.play(Create(plane))
+        self.play(FadeIn(image), Create(dots))
+        self.play(Write(title))
+        self.wait(2)
+
+
+class NewtonStrip(Scene):
+    def construct(self):
+        ax = shared_axes(x_range=(-6, 6), y_range=(-3, 3), axis_config={"include_tip": False})
+        curve = ax.plot(lambda x: 0.3 * x**2 - 2, color=BLUE)
+        labels = background(ax.get_axis_labels(x_label="x", y_label="f(x)=x^2-a"))
+        start, end = ax.c2p(-6, 0), ax.c2p(6, 0)
+        width = int(round((end[0] - start[0]) / config.frame_width * config.pixel_width))
+        pixels = basin_pixels([0.3, 0, -2], (-6, 6), (0, 0), width, 1, [color_to_rgb(PINK), color_to_rgb(YELLOW_E)])
+        strip = ImageMobject(pixels).stretch_to_fit_width(end[0] - start[0]).stretch_to_fit_height(0.3).next_to(ax.c2p(0, 0), DOWN, buff=0.2)
+
+        self.play(Create(VGroup(ax, curve, labels)))
+        self.play(FadeIn(strip))
+        self.wait(2)
@@ -0,0 +1,90 @@
+"""
+newton_solver.py
+
+Vectorized Newton-Raphson iteration with a recorded history.
+
+newton(f, x0) runs x_{n+1} = x_n - f(x_n) / f'(x_n) on a whole NumPy array of starting
+points at once and keeps every iterate, so a scene can draw any iteration of any start
+(dots, tangents, dashed lines) from one numeric pass. Each start stops moving once its
+step falls below the tolerance; starts that hit a zero derivative or leave the finite
+numbers are marked as failed instead of raising.
+
+f' can be given, or is taken from derivatives.taylor_coefficients (exact Taylor-mode
+differentiation of an f written with NumPy functions, real arguments only). Complex
+iterations such as z^3 - 1 need an explicit df.
+
+Classes:
+- NewtonHistory: Iterates, function values, slopes and convergence masks of one run.
+
+Functions:
+- newton(f, x0, df, iterations, tol): Run Newton's method from every point of x0.
+
+Dependencies: Requires numpy and derivatives.
+
+"""
+
+import numpy as np
+from derivatives import taylor_coefficients
+
+
+class NewtonHistory:
+    """
+    x[n], fx[n] and dfx[n] hold iterate n of every start (shape (steps + 1,) + x0.shape);
+    converged[n] marks the starts whose step had fallen below tol by iterate n, failed the
+    starts whose iteration broke down.
+    """
+
+    def __init__(self, x, fx, dfx, converged, failed):
+        self.x = x
+        self.fx = fx
+        self.dfx = dfx
+        self.converged = converged
+        self.failed = failed
+
+    @property
+    def root(self):
+        return self.x[-1]
+
+    @property
+    def iterations_to_converge(self):
+        """First iterate at which each start had converged, -1 where it never did."""
+        first = np.argmax(self.converged, axis=0)
+        return np.where(self.converged[-1], first, -1)
+
+    def tangent(self, n):
+        """Slope and x-intercept (the next iterate) of the tangent at iterate n."""
+        return self.dfx[n], self.x[n] - self.fx[n] / self.dfx[n]
+
+
+def _derivative(f):
+    return lambda x: taylor_coefficients(f, 1, x)[1]
+
+
+def newton(f, x0, df=None, iterations=10, tol=1e-12):
+    """
+    Run up to `iterations` Newton steps from every point of x0, stopping early once every
+    start has converged or failed. f and df must accept arrays.
+    """
+    df = df or _derivative(f)
+    x = np.array(x0, dtype=np.result_type(x0, float))
+    converged = np.zeros(x.shape, dtype=bool)
+    failed = np.zeros(x.shape, dtype=bool)
+    xs, fxs, dfxs, converged_masks, failed_masks = [], [], [], [], []
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        for _ in range(iterations + 1):
+            fx = f(x) * np.ones(x.shape)
+            dfx = df(x) * np.ones(x.shape)
+            xs.append(x)
+            fxs.append(fx)
+            dfxs.append(dfx)
+            converged_masks.append(converged)
+            failed_masks.append(failed)
+            if len(xs) > iterations or (converged | failed).all():
+                break
+            step = fx / dfx
+            active = ~(converged | failed)
+            failed = failed | (active & ~np.isfinite(step))
+            active &= ~failed
+            x = np.where(active, x - step, x)
+            converged = converged | (active & (np.abs(step) <= tol * (1 + np.abs(x))))
+    return NewtonHistory(np.array(xs), np.array(fxs), np.array(dfxs), np.array(converged_masks), np.array(failed_masks))
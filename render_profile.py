@@ -0,0 +1,313 @@
+"""
+render_profile.py
+
+Where the render time of a scene goes, play by play.
+
+profile_scene renders a scene with Manim's render path instrumented and splits the wall
+time of every self.play / self.wait by stage:
+
+- updaters: each updater function, named after the scene's own function (the lambda
+  passed to always_redraw, not Manim's wrapper around it);
+- interpolation: the animations' interpolate calls and the rest of Scene.update_to_time;
+- rasterization: Cairo drawing (CairoRenderer.update_frame);
+- encoding: handing frames to ffmpeg, including waiting for the pipe or the frame pool;
+- latex and svg: TeX compilation and SVG parsing, wherever they happen;
+- hashing: naming the partial movie file;
+- other: the rest of the play.
+
+Time is exclusive: a MathTex built inside an always_redraw lambda counts as latex, not as
+updater time. The counters also record TeX requests and compiles (requests minus compiles
+are Manim's .svg cache hits), frames written, and the parsed-SVG cache of svg_cache, per
+play and for the whole scene.
+Work outside the plays (construct building mobjects) is reported separately.
+
+Two files are written to <media_dir>/profiles: <Scene>.json with the per-play report and
+the hot spots, and <Scene>.folded with one "scene;play;stage;function microseconds" line
+per stack, for flamegraph.pl, inferno or speedscope.
+
+Only the main thread is timed. TeX built on a LazyMobjects prefetch thread is counted but
+not timed.
+
+Classes:
+- RenderProfile: Exclusive time per stack of sections, per play, for one scene.
+
+Functions:
+- profile_scene(scene_class, overrides, output_dir, top): Render a scene under the profiler and write its report.
+
+Usage: python render_profile.py taylor_series [GeneralProof ...] [--quality low_quality] [--top 15]
+
+Dependencies: Requires Manim and svg_cache.
+
+"""
+
+from collections import defaultdict
+from contextlib import contextmanager
+from pathlib import Path
+import argparse
+import functools
+import importlib
+import inspect
+import json
+import threading
+import time
+from manim import *
+import manim.mobject.text.tex_mobject as tex_mobject
+import manim.renderer.cairo_renderer as cairo_renderer
+import manim.utils.tex_file_writing as tex_file_writing
+import svg_cache
+
+STAGES = ["updaters", "interpolation", "rasterization", "encoding", "latex", "svg", "hashing", "other"]
+
+_active = None
+
+
+class RenderProfile:
+    """
+    Sections nest like a call stack; elapsed time always goes to the innermost one, both
+    in `folded` (keyed by the stack of labels) and in the current play's record.
+    """
+
+    def __init__(self, scene_name):
+        self.scene_name = scene_name
+        self.thread = threading.get_ident()
+        self.folded = defaultdict(float)
+        self.outside = self._record()
+        self.plays = []
+        self._record_stack = [self.outside]
+        self._stack = [("other", scene_name)]
+        self._lock = threading.Lock()
+        self._start = self._mark = time.perf_counter()
+        self.wall_seconds = None
+        self.svg_cache = {}
+
+    @staticmethod
+    def _record(**fields):
+        return {**fields, "seconds": defaultdict(float), "updaters": defaultdict(float), "counters": defaultdict(int)}
+
+    def _charge(self):
+        now = time.perf_counter()
+        elapsed, self._mark = now - self._mark, now
+        self.folded[tuple(label for _, label in self._stack)] += elapsed
+        category, label = self._stack[-1]
+        record = self._record_stack[-1]
+        record["seconds"][category] += elapsed
+        if category == "updaters":
+            record["updaters"][label.removeprefix("updater ")] += elapsed
+
+    def timed(self):
+        return threading.get_ident() == self.thread
+
+    @contextmanager
+    def section(self, category, label=None):
+        self._charge()
+        self._stack.append((category, label or category))
+        try:
+            yield
+        finally:
+            self._charge()
+            self._stack.pop()
+
+    @contextmanager
+    def play(self, index):
+        record = self._record(index=index)
+        self.plays.append(record)
+        self._record_stack.append(record)
+        try:
+            with self.section("other", f"play {index}"):
+                yield record
+        finally:
+            self._record_stack.pop()
+            label = f"play {index} {'+'.join(record.get('animations', []))}".strip()
+            # The label is only known once the play has compiled its animations
+            for stack in [stack for stack in self.folded if stack[1:2] == (f"play {index}",)]:
+                self.folded[stack[:1] + (label,) + stack[2:]] += self.folded.pop(stack)
+
+    def count(self, counter, n=1):
+        with self._lock:
+            self._record_stack[-1]["counters"][counter] += n
+
+    def finish(self):
+        self._charge()
+        self.wall_seconds = time.perf_counter() - self._start
+
+    def hot_spots(self, top=10):
+        """The `top` largest (seconds, play, stage or updater) entries over all plays."""
+        spots = []
+        for record in self.plays:
+            name = f"play {record['index']} {'+'.join(record.get('animations', []))}"
+            spots += [(seconds, name, stage) for stage, seconds in record["seconds"].items() if stage != "updaters"]
+            spots += [(seconds, name, f"updater {updater}") for updater, seconds in record["updaters"].items()]
+        spots += [(seconds, "outside plays", stage) for stage, seconds in self.outside["seconds"].items()]
+        return sorted(spots, reverse=True)[:top]
+
+    def report(self, top=10):
+        totals = defaultdict(float)
+        counters = defaultdict(int)
+        for record in self.plays + [self.outside]:
+            for stage, seconds in record["seconds"].items():
+                totals[stage] += seconds
+            for counter, n in record["counters"].items():
+                counters[counter] += n
+        return {
+            "scene": self.scene_name,
+            "resolution": [config.pixel_width, config.pixel_height],
+            "frame_rate": config.frame_rate,
+            "wall_seconds": self.wall_seconds,
+            "totals": {stage: totals[stage] for stage in STAGES},
+            "counters": counters,
+            "svg_cache": self.svg_cache,
+            "hot_spots": [{"seconds": seconds, "where": where, "what": what} for seconds, where, what in self.hot_spots(top)],
+            "outside_plays": self.outside,
+            "plays": self.plays,
+        }
+
+    def folded_lines(self):
+        return [f"{';'.join(stack)} {round(1e6 * seconds)}" for stack, seconds in self.folded.items() if seconds >= 1e-6]
+
+
+def _profiled(category, function, counter=None):
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        profile = _active
+        if profile is None:
+            return function(*args, **kwargs)
+        if counter:
+            profile.count(counter)
+        if not profile.timed():
+            return function(*args, **kwargs)
+        with profile.section(category, f"{category} ({function.__name__})"):
+            return function(*args, **kwargs)
+    return wrapper
+
+
+def _updater_name(updater):
+    function = getattr(updater, "__func__", updater)
+    # always_redraw, f_always and friends wrap the scene's function in a Manim lambda
+    while getattr(function, "__module__", "").startswith("manim") and getattr(function, "__closure__", None):
+        inner = [cell.cell_contents for cell in function.__closure__ if inspect.isfunction(cell.cell_contents)]
+        if not inner:
+            break
+        function = inner[0]
+    code = getattr(function, "__code__", None)
+    if code is None:
+        return type(updater).__qualname__
+    return f"{function.__qualname__} ({Path(code.co_filename).name}:{code.co_firstlineno})"
+
+
+def _profiled_update(self, dt=0, recursive=True):
+    # Mobject.update, timing every updater on its own
+    profile = _active
+    if profile is None or not profile.timed():
+        return _mobject_update(self, dt, recursive)
+    if self.updating_suspended:
+        return self
+    for updater in self.updaters:
+        with profile.section("updaters", f"updater {_updater_name(updater)}"):
+            if "dt" in inspect.signature(updater).parameters:
+                updater(self, dt)
+            else:
+                updater(self)
+    if recursive:
+        for submob in self.submobjects:
+            submob.update(dt, recursive)
+    return self
+
+
+def _profiled_play(self, scene, *args, **kwargs):
+    profile = _active
+    if profile is None:
+        return _renderer_play(self, scene, *args, **kwargs)
+    svg_before = dict(svg_cache.stats)
+    with profile.play(self.num_plays) as record:
+        try:
+            _renderer_play(self, scene, *args, **kwargs)
+        finally:
+            animations = getattr(scene, "animations", None) or []
+            record["animations"] = [type(animation).__name__ for animation in animations]
+            record["kind"] = "wait" if animations and all(isinstance(animation, Wait) for animation in animations) else "play"
+            record["run_time"] = getattr(scene, "duration", None)
+            record["skipped"] = self.skip_animations
+            for key, value in svg_cache.stats.items():
+                # svg_cache resets its counters after each scene, never inside a play
+                record["counters"][f"svg_cache_{key}"] += value - svg_before.get(key, 0)
+
+
+def _profiled_log_stats(label):
+    # svg_cache logs and resets its counters at the end of each scene; keep the scene's totals
+    if _active is not None:
+        _active.svg_cache = dict(svg_cache.stats)
+    _log_svg_stats(label)
+
+
+_mobject_update = Mobject.update
+_log_svg_stats = svg_cache.log_stats
+_renderer_play = None
+
+
+def _install():
+    # Wraps whatever is installed when the first profile starts, so it sits on top of the other caches
+    global _renderer_play
+    if _renderer_play is not None:
+        return
+    _renderer_play = cairo_renderer.CairoRenderer.play
+    cairo_renderer.CairoRenderer.play = _profiled_play
+    Mobject.update = _profiled_update
+    Scene.update_to_time = _profiled("interpolation", Scene.update_to_time)
+    cairo_renderer.CairoRenderer.update_frame = _profiled("rasterization", cairo_renderer.CairoRenderer.update_frame)
+    SceneFileWriter.write_frame = _profiled("encoding", SceneFileWriter.write_frame, counter="frames")
+    SceneFileWriter.open_movie_pipe = _profiled("encoding", SceneFileWriter.open_movie_pipe)
+    SceneFileWriter.close_movie_pipe = _profiled("encoding", SceneFileWriter.close_movie_pipe)
+    cairo_renderer.get_hash_from_play_call = _profiled("hashing", cairo_renderer.get_hash_from_play_call)
+    tex_mobject.tex_to_svg_file = _profiled("latex", tex_mobject.tex_to_svg_file, counter="tex_requests")
+    tex_file_writing.compile_tex = _profiled("latex", tex_file_writing.compile_tex, counter="tex_compiles")
+    tex_file_writing.convert_to_svg = _profiled("latex", tex_file_writing.convert_to_svg)
+    SVGMobject.init_svg_mobject = _profiled("svg", SVGMobject.init_svg_mobject)
+    svg_cache.log_stats = _profiled_log_stats
+
+
+def profile_scene(scene_class, overrides=None, output_dir=None, top=10):
+    """
+    Render scene_class under the profiler and write <Scene>.json and <Scene>.folded to
+    `output_dir` (default <media_dir>/profiles). Returns the report.
+    """
+    global _active
+    _install()
+    with tempconfig(overrides or {}):
+        output_dir = Path(output_dir or Path(config.media_dir) / "profiles")
+        output_dir.mkdir(parents=True, exist_ok=True)
+        profile = RenderProfile(scene_class.__name__)
+        _active = profile
+        try:
+            scene_class().render()
+        finally:
+            _active = None
+            profile.finish()
+        report = profile.report(top)
+    name = scene_class.__name__
+    (output_dir / f"{name}.json").write_text(json.dumps(report, indent=2), encoding="utf-8")
+    (output_dir / f"{name}.folded").write_text("\n".join(profile.folded_lines()) + "\n", encoding="utf-8")
+    return report
+
+
+def _print_report(report):
+    totals = ", ".join(f"{stage} {seconds:.2f}s" for stage, seconds in report["totals"].items() if seconds >= 0.005)
+    print(f"{report['scene']}: {report['wall_seconds']:.2f}s ({totals})")
+    for spot in report["hot_spots"]:
+        print(f"  {spot['seconds']:8.3f}s  {spot['where']:<40.40}  {spot['what']}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Profile the render of each scene of a module, play by play.")
+    parser.add_argument("module")
+    parser.add_argument("scenes", nargs="*", help="scene names (default: every scene defined in the module)")
+    parser.add_argument("--quality", default="low_quality", help="Manim quality preset to render at")
+    parser.add_argument("--output-dir", default=None)
+    parser.add_argument("--top", type=int, default=10, help="number of hot spots to report")
+    args = parser.parse_args()
+    module = importlib.import_module(args.module)
+    names = args.scenes or [
+        name for name, value in vars(module).items()
+        if inspect.isclass(value) and issubclass(value, Scene) and value.__module__ == module.__name__
+    ]
+    for name in names:
+        _print_report(profile_scene(getattr(module, name), {"quality": args.quality}, args.output_dir, args.top))
@@ -0,0 +1,256 @@
+"""
+render_tools.py
+
+Helpers for rendering the animation scripts outside of the plain `manim -pqh file.py Scene` flow.
+
+Sharded rendering: a long video whose segments are independent (for example the 13
+functions of TaylorSeriesExpansion, which clears the screen between them) can be split
+into separately addressable sub-scenes. render_sharded renders each of them in its own
+worker process and joins their partial movie files, in order, into the one output file
+the serial render would have produced. The module's literal TeX is precompiled first
+(tex_cache), so the workers do not compile the same expressions side by side.
+
+Segment-parallel rendering: a long linear scene (TaylorProofCos, GeneralProof, Newton)
+is first run once with animations skipped, which only counts its plays and their run
+times. Worker processes then split the plays into contiguous ranges of roughly equal
+duration. Each worker replays construct() with the plays before its range skipped
+(Manim's from_animation_number mechanism), so it reaches the exact scene state at the
+start of the range with updaters and trackers intact. It rasterizes and encodes only
+its own plays into the usual partial_movie_files directory. The parent joins them in
+play order with Manim's own combine_to_movie.
+
+Still rendering: scenes that only add mobjects (thumbnails) end up as one PNG anyway, but
+`manim` still runs them through the movie pipeline. render_still builds the scene,
+rasterizes it once without ticking updaters and writes the PNG Manim would have written.
+render_stills does the same for a list of variants (class attributes such as titles,
+colors or x0) in one process, so the Tex compiled and parsed for one variant is reused
+by the next.
+
+Render stack: the caches and frame-path optimizations of this repo each wrap Manim
+functions that the ones before them may already have wrapped. enable_render_stack
+installs all of them once per process, always in the same order. The scene modules call
+it, so importing several of them (or profiling one) keeps a single, complete stack.
+
+Functions:
+- enable_render_stack(): Install every render optimization, once, in a fixed order.
+- render_scene(module_name, scene_name, overrides): Render one scene, returning its partial movie files.
+- concat_movies(movie_files, output_file): Join movie files in order without re-encoding.
+- render_sharded(module_name, scene_names, output_name, overrides, processes): Render scenes in a process pool and join them.
+- play_durations(module_name, scene_name, overrides): Run time of every play, from a skipped dry run.
+- render_play_range(module_name, scene_name, start, end, overrides): Render plays start..end-1 of a scene.
+- render_parallel(module_name, scene_name, overrides, processes): Render one scene's plays in a process pool.
+- is_still_scene(scene_class): Whether construct never plays or waits.
+- render_still(scene_class, overrides): Rasterize a still scene once and save it as PNG.
+- render_stills(scene_class, variants, overrides): render_still for each variant of a scene.
+
+Usage: python render_tools.py newton_raphson YThumbnail [--variants]
+       python render_tools.py taylor_series TaylorProofCos --parallel
+
+Dependencies: Requires Manim, ffmpeg, tex_cache and the render-stack modules (svg_cache,
+animation_cache, frame_pipeline, axes_cache, dirty_regions, frame_hold, curve_morph).
+
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+import argparse
+import ast
+import importlib
+import importlib.util
+import inspect
+import os
+import subprocess
+import textwrap
+from manim import *
+from manim.utils.exceptions import EndSceneEarlyException
+from tex_cache import precompile_module
+from svg_cache import enable_svg_cache
+from animation_cache import enable_semantic_cache
+from frame_pipeline import enable_frame_pipeline
+from axes_cache import enable_static_layer
+from dirty_regions import enable_dirty_regions
+from frame_hold import enable_frame_hold
+from curve_morph import enable_curve_morph
+
+
+def enable_render_stack():
+    """
+    Install the render optimizations in their fixed order, each wrapping the ones before
+    it. Every enable is one-shot, so calling this again (from another scene module) changes
+    nothing.
+    """
+    enable_svg_cache()
+    enable_semantic_cache()
+    enable_frame_pipeline()
+    enable_static_layer()
+    enable_dirty_regions()
+    enable_frame_hold()
+    enable_curve_morph()
+
+
+def render_scene(module_name, scene_name, overrides=None):
+    # Workers may be spawned rather than forked, so the config is applied here, not inherited
+    module = importlib.import_module(module_name)
+    with tempconfig(overrides or {}):
+        scene = getattr(module, scene_name)()
+        scene.render()
+        file_writer = scene.renderer.file_writer
+        partial_movie_files = [str(path) for path in file_writer.partial_movie_files if path is not None]
+        return partial_movie_files, str(file_writer.movie_file_path)
+
+
+def concat_movies(movie_files, output_file):
+    output_file = Path(output_file)
+    file_list = output_file.with_name(f"{output_file.stem}_file_list.txt")
+    with file_list.open("w", encoding="utf-8") as fp:
+        fp.write("# This file is used internally by FFMPEG.\n")
+        for path in movie_files:
+            fp.write(f"file 'file:{Path(path).as_posix()}'\n")
+    subprocess.run(
+        [
+            config.ffmpeg_executable, "-y", "-f", "concat", "-safe", "0", "-i", str(file_list),
+            "-loglevel", config.ffmpeg_loglevel.lower(), "-nostdin", "-c", "copy", "-an", str(output_file),
+        ],
+        check=True,
+    )
+    file_list.unlink()
+    logger.info("Sharded movie ready at %(path)s", {"path": str(output_file)})
+    return output_file
+
+
+def render_sharded(module_name, scene_names, output_name, overrides=None, processes=None):
+    """
+    Render `scene_names` from `module_name` with one worker per core (or `processes`) and
+    concatenate all of their partial movie files, in the given order, into `output_name`
+    next to the shard movies.
+    """
+    count = len(scene_names)
+    precompile_module(importlib.util.find_spec(module_name).origin, processes)
+    with ProcessPoolExecutor(max_workers=min(processes or os.cpu_count(), count)) as pool:
+        results = list(pool.map(render_scene, [module_name] * count, scene_names, [overrides] * count))
+    partial_movie_files = [path for files, _ in results for path in files]
+    output_file = Path(results[0][1]).with_name(f"{output_name}{config.movie_file_extension}")
+    return concat_movies(partial_movie_files, output_file)
+
+
+def play_durations(module_name, scene_name, overrides=None):
+    durations = []
+
+    class Timed(getattr(importlib.import_module(module_name), scene_name)):
+        def play(self, *args, **kwargs):
+            super().play(*args, **kwargs)
+            durations.append(self.duration)
+
+    Timed.__name__ = Timed.__qualname__ = scene_name
+    with tempconfig({**(overrides or {}), "skip_animations": True, "write_to_movie": False, "save_last_frame": False}):
+        Timed().render()
+    return durations
+
+
+def render_play_range(module_name, scene_name, start, end, overrides=None):
+    """Partial movie files of plays start..end-1; the earlier plays only update the scene state."""
+
+    class Ranged(getattr(importlib.import_module(module_name), scene_name)):
+        def play(self, *args, **kwargs):
+            if self.renderer.num_plays >= end:
+                raise EndSceneEarlyException()
+            super().play(*args, **kwargs)
+
+    # The file writer names its directories after the scene class
+    Ranged.__name__ = Ranged.__qualname__ = scene_name
+    with tempconfig({**(overrides or {}), "from_animation_number": start}):
+        scene = Ranged()
+        scene.setup()
+        try:
+            scene.construct()
+        except EndSceneEarlyException:
+            pass
+        return scene.renderer.file_writer.partial_movie_files[start:end]
+
+
+def _balanced_ranges(durations, count):
+    # Contiguous ranges of plays with about the same total run time, each play going to the range its midpoint falls in
+    ends = np.cumsum(durations)
+    cuts = np.searchsorted(ends - np.asarray(durations) / 2, ends[-1] * np.arange(1, count) / count)
+    bounds = sorted(set([0, *cuts.tolist(), len(durations)]))
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def render_parallel(module_name, scene_name, overrides=None, processes=None):
+    """
+    Render scene_name with its plays spread over `processes` workers (default: one per core)
+    and combine the segments into the scene's movie file, as `manim` would have written it.
+    """
+    precompile_module(importlib.util.find_spec(module_name).origin, processes)
+    durations = play_durations(module_name, scene_name, overrides)
+    ranges = _balanced_ranges(durations, min(processes or os.cpu_count(), len(durations)))
+    count = len(ranges)
+    with ProcessPoolExecutor(max_workers=count) as pool:
+        segments = pool.map(
+            render_play_range, [module_name] * count, [scene_name] * count,
+            [start for start, _ in ranges], [end for _, end in ranges], [overrides] * count,
+        )
+        partial_movie_files = [path for files in segments for path in files]
+    with tempconfig(overrides or {}):
+        file_writer = getattr(importlib.import_module(module_name), scene_name)().renderer.file_writer
+        file_writer.partial_movie_files = partial_movie_files
+        file_writer.combine_to_movie()
+        return file_writer.movie_file_path
+
+
+ANIMATING_CALLS = {"play", "wait", "pause", "wait_until"}
+
+
+def is_still_scene(scene_class):
+    tree = ast.parse(textwrap.dedent(inspect.getsource(scene_class.construct)))
+    return not any(isinstance(node, ast.Attribute) and node.attr in ANIMATING_CALLS for node in ast.walk(tree))
+
+
+def render_still(scene_class, overrides=None):
+    """
+    Build scene_class, draw its mobjects once at the configured resolution and save the
+    PNG where `manim` would (media/images/<module>/<Scene>_ManimCE_v<version>.png).
+    No movie file, partial movie directory or encoder is set up.
+    """
+    if not is_still_scene(scene_class):
+        raise ValueError(f"{scene_class.__name__} plays animations, render it with manim")
+    settings = {"input_file": inspect.getfile(scene_class), **(overrides or {}), "write_to_movie": False, "save_last_frame": True}
+    with tempconfig(settings):
+        scene = scene_class()
+        scene.setup()
+        scene.construct()
+        renderer = scene.renderer
+        renderer.update_frame(scene)
+        renderer.file_writer.save_final_image(renderer.camera.get_image())
+        return renderer.file_writer.image_file_path
+
+
+def render_stills(scene_class, variants=None, overrides=None):
+    """
+    Render one still per variant: a dict of class attributes to override, plus an optional
+    "name" for the output file (default <Scene>00, <Scene>01, ...). Defaults to
+    scene_class.variants.
+    """
+    paths = []
+    for i, variant in enumerate(variants if variants is not None else scene_class.variants):
+        # type() would set __module__ to the caller's; keep the images next to the scene's own
+        attributes = {"__module__": scene_class.__module__, **{key: value for key, value in variant.items() if key != "name"}}
+        variant_class = type(variant.get("name", f"{scene_class.__name__}{i:02d}"), (scene_class,), attributes)
+        paths.append(render_still(variant_class, overrides))
+    return paths
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Render a still scene straight to PNG, or an animated one in parallel.")
+    parser.add_argument("module")
+    parser.add_argument("scene")
+    parser.add_argument("--variants", action="store_true", help="render every entry of the scene's `variants`")
+    parser.add_argument("--parallel", action="store_true", help="render an animated scene's plays in a process pool")
+    args = parser.parse_args()
+    scene_class = getattr(importlib.import_module(args.module), args.scene)
+    if args.parallel:
+        render_parallel(args.module, args.scene)
+    elif args.variants:
+        render_stills(scene_class)
+    else:
+        render_still(scene_class)
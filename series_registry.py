@@ -0,0 +1,139 @@
+"""
+series_registry.py
+
+Registry of the power series shown in the Taylor series videos.
+
+Each series is stored once, as a first coefficient, the power of its first non-zero term,
+the step between powers and a term-ratio recurrence (tan(x) uses the tangent numbers
+instead). Exact rational coefficients are computed with that recurrence, memoized up to
+the highest order requested so far, and used for both the plotted partial sums and the
+LaTeX terms of the expansion, so the curve and the formula on screen always come from
+the same numbers.
+
+Functions:
+- coefficients(name, count): The first `count` non-zero coefficients as exact Fractions.
+- powers(name, count): The powers of x carrying those coefficients.
+- dense_coefficients(name, count): Float coefficients c_0..c_d for taylor_engine.
+- expansion_tex(name, count): LaTeX strings of the first `count` terms plus the trailing "+ ....∞".
+- zigzag_numbers(count): Euler zigzag numbers E_0..E_{count-1} from a cached Seidel boustrophedon.
+
+Adding a series is one call to register(...).
+
+Dependencies: Requires numpy and the standard library (fractions, math).
+
+"""
+
+from fractions import Fraction
+from functools import lru_cache
+import math as m
+import numpy as np
+
+SERIES = {}
+_tables = {}
+
+
+def register(name, first, ratio=None, power=0, step=1, style="factorial", term=None):
+    """
+    Add a series whose k-th non-zero term is a_k x^(power + k*step) with a_0 = first
+    and a_{k+1} = a_k * ratio(k), or a_k = term(k) for series without a term ratio.
+    `style` picks how terms are typeset: "factorial" writes 1/n! coefficients as
+    \\frac{x^p}{n!}, "rational" writes \\frac{3x^5}{40}.
+    """
+    SERIES[name] = {"first": Fraction(first), "ratio": ratio, "term": term, "power": power, "step": step, "style": style}
+    _tables[name] = [Fraction(first)]
+
+
+def coefficients(name, count):
+    table = _tables[name]
+    series = SERIES[name]
+    while len(table) < count:
+        k = len(table)
+        table.append(series["term"](k) if series["term"] else table[-1] * series["ratio"](k - 1))
+    return table[:count]
+
+
+def powers(name, count):
+    series = SERIES[name]
+    return [series["power"] + k * series["step"] for k in range(count)]
+
+
+@lru_cache(maxsize=None)
+def dense_coefficients(name, count):
+    coeffs = np.zeros(powers(name, count)[-1] + 1)
+    coeffs[powers(name, count)] = [float(c) for c in coefficients(name, count)]
+    coeffs.setflags(write=False)
+    return coeffs
+
+
+_zigzag = [1]
+_boustrophedon_row = [1]
+
+
+def zigzag_numbers(count):
+    """
+    E_n counts alternating permutations: E_{2k+1} are the tangent numbers (1, 2, 16, 272, ...)
+    and E_{2k} the secant numbers, so tan(x) = sum E_{2k+1} x^(2k+1) / (2k+1)!, the integer form
+    of the Bernoulli coefficients (-1)^(k-1) 2^(2k) (2^(2k)-1) B_{2k} / (2k)! of x^(2k-1). Each new row of the Seidel
+    boustrophedon is a running sum over the previous row read backwards; the last row is kept
+    so the table only grows by the missing orders.
+    """
+    global _boustrophedon_row
+    while len(_zigzag) < count:
+        row = [0]
+        for value in reversed(_boustrophedon_row):
+            row.append(row[-1] + value)
+        _boustrophedon_row = row
+        _zigzag.append(row[-1])
+    return _zigzag[:count]
+
+
+def _power_tex(p):
+    if p == 0:
+        return ""
+    if p == 1:
+        return "x"
+    return f"x^{p}" if p < 10 else f"x^{{{p}}}"
+
+
+def _factorial_tex(d):
+    n = 0
+    while m.factorial(n) < d:
+        n += 1
+    return f"{n}!" if m.factorial(n) == d else str(d)
+
+
+def _term_tex(c, p, style):
+    c = abs(c)
+    x = _power_tex(p)
+    if c.denominator == 1:
+        return x if c == 1 and x else f"{c.numerator}{x}"
+    numerator = x if c.numerator == 1 and x else f"{c.numerator}{x}"
+    denominator = _factorial_tex(c.denominator) if style == "factorial" else str(c.denominator)
+    return f"\\frac{{{numerator}}}{{{denominator}}}"
+
+
+def expansion_tex(name, count):
+    style = SERIES[name]["style"]
+    terms = []
+    for k, (c, p) in enumerate(zip(coefficients(name, count), powers(name, count))):
+        term = _term_tex(c, p, style)
+        if k == 0:
+            terms.append(term if c > 0 else f"-{term}")
+        else:
+            terms.append(f" {'+' if c > 0 else '-'} {term}")
+    return terms + [r"+ ............\infty"]
+
+
+register("sin", 1, lambda k: Fraction(-1, (2*k+2) * (2*k+3)), power=1, step=2)
+register("cos", 1, lambda k: Fraction(-1, (2*k+1) * (2*k+2)), step=2)
+register("tan", 1, term=lambda k: Fraction(zigzag_numbers(2*k+2)[2*k+1], m.factorial(2*k+1)), power=1, step=2, style="rational")
+register("sinh", 1, lambda k: Fraction(1, (2*k+2) * (2*k+3)), power=1, step=2)
+register("cosh", 1, lambda k: Fraction(1, (2*k+1) * (2*k+2)), step=2)
+register("arcsin", 1, lambda k: Fraction((2*k+1)**2, (2*k+2) * (2*k+3)), power=1, step=2, style="rational")
+register("arcsinh", 1, lambda k: Fraction(-(2*k+1)**2, (2*k+2) * (2*k+3)), power=1, step=2, style="rational")
+register("arctanh", 1, lambda k: Fraction(2*k+1, 2*k+3), power=1, step=2, style="rational")
+register("ln(1+x)", 1, lambda k: Fraction(-(k+1), k+2), power=1, style="rational")
+register("e^x", 1, lambda k: Fraction(1, k+1))
+register("e^{x^2}", 1, lambda k: Fraction(1, k+1), step=2)
+register("1/(1-x)", 1, lambda k: Fraction(1))
+register("1/(1+x)", 1, lambda k: Fraction(-1))
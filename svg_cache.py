@@ -0,0 +1,171 @@
+"""
+svg_cache.py
+
+Parsed-SVG cache for MathTex/Tex, layered over Manim's media/Tex SVG cache.
+
+With the Tex SVGs on disk, every MathTex still re-reads and re-parses its SVG files
+(the joined string and each part), and Manim's own in-process map stores whole
+mobjects and returns deep copies of them. enable_svg_cache replaces that step with:
+
+- an LRU of parsed glyphs (point arrays and RGBA style arrays, one entry per SVG),
+  handed out as fresh mobjects of the parsed parts' classes (VMobjectFromSVGPath for
+  glyphs, Rectangle for rules) built from copies of those arrays, without re-reading
+  the path data;
+- an optional on-disk layer in media/TexParsed, keyed like the Tex SVGs themselves
+  (the hash of the full .tex source, so the template is part of the key), which lets
+  later runs and sharded workers skip SVG parsing entirely. It sits next to media/Tex,
+  not inside it, because Manim's LaTeX cleanup unlinks everything in that directory
+  that is not a .tex or .svg file.
+
+The LRU and the counters are shared with the threads that prefetch lazy mobjects, so
+they are only touched under a lock. Counters are kept in `stats` and logged after every
+rendered scene.
+
+Functions:
+- enable_svg_cache(maxsize, disk): Route SVGMobject parsing through the cache.
+- log_stats(label): Log the hit/miss counters and reset them.
+
+Dependencies: Requires Manim and numpy.
+
+"""
+
+from collections import OrderedDict
+import hashlib
+import io
+import os
+import threading
+import numpy as np
+import svgelements as se
+from manim import *
+from manim.mobject.svg.svg_mobject import SVGMobject, VMobjectFromSVGPath
+from manim.utils.iterables import hash_obj
+
+STYLE_ATTRS = ["fill_rgbas", "stroke_rgbas", "background_stroke_rgbas", "stroke_width", "background_stroke_width"]
+# What SVGMobject.get_mobjects_from builds; SVGs with other parts are not cached
+PART_CLASSES = {cls.__name__: cls for cls in [VMobjectFromSVGPath, Line, Rectangle, RoundedRectangle, Circle, VMobject]}
+
+stats = {"hits": 0, "disk_hits": 0, "misses": 0}
+_cache = OrderedDict()
+_lock = threading.Lock()
+_settings = {"maxsize": 256, "disk": True, "installed": False}
+_wrapped = {}
+
+
+def _disk_path(svg):
+    tex_dir = config.get_dir("tex_dir")
+    if svg.file_name is None or svg.file_name.parent.resolve() != tex_dir.resolve():
+        return None
+    seed = repr(("parts", svg.__class__.__name__, svg.svg_default, svg.path_string_config))
+    digest = hashlib.sha256(seed.encode()).hexdigest()[:8]
+    return tex_dir.parent / "TexParsed" / f"{svg.file_name.stem}_{digest}.npz"
+
+
+def _snapshot(svg):
+    if any(part.submobjects or PART_CLASSES.get(type(part).__name__) is not type(part) for part in svg.submobjects):
+        return None
+    entry = []
+    for part in svg.submobjects:
+        arrays = {"class": np.array(type(part).__name__), "points": part.points.copy()}
+        arrays.update({attr: np.array(getattr(part, attr), dtype=float) for attr in STYLE_ATTRS})
+        entry.append(arrays)
+    return entry
+
+
+def _restore(svg, entry):
+    parts = []
+    for arrays in entry:
+        cls = PART_CLASSES[str(arrays["class"])]
+        # An empty path: the points come from the cache, not from the SVG
+        part = VMobjectFromSVGPath(se.Path(), **svg.path_string_config) if cls is VMobjectFromSVGPath else cls()
+        part.points = arrays["points"].copy()
+        for attr in STYLE_ATTRS:
+            value = arrays[attr]
+            setattr(part, attr, float(value) if value.ndim == 0 else value.copy())
+        parts.append(part)
+    svg.add(*parts)
+
+
+def _load(path):
+    with np.load(path) as data:
+        count = len(data.files) // (len(STYLE_ATTRS) + 2)
+        return [{name: data[f"{i}_{name}"] for name in ["class", "points"] + STYLE_ATTRS} for i in range(count)]
+
+
+def _save(path, entry):
+    # Written in one rename so concurrent workers never read a partial file
+    path.parent.mkdir(parents=True, exist_ok=True)
+    buffer = io.BytesIO()
+    np.savez(buffer, **{f"{i}_{name}": value for i, arrays in enumerate(entry) for name, value in arrays.items()})
+    temp_path = path.with_name(f"{path.stem}.{os.getpid()}.tmp")
+    temp_path.write_bytes(buffer.getvalue())
+    temp_path.replace(path)
+
+
+def _remember(key, entry):
+    # Called with _lock held
+    _cache[key] = entry
+    _cache.move_to_end(key)
+    while len(_cache) > _settings["maxsize"]:
+        _cache.popitem(last=False)
+
+
+def _init_svg_mobject(self, use_svg_cache):
+    if not use_svg_cache or config.renderer != RendererType.CAIRO:
+        return _wrapped["init_svg_mobject"](self, use_svg_cache)
+    key = hash_obj(self.hash_seed)
+    with _lock:
+        entry = _cache.get(key)
+        if entry is not None:
+            stats["hits"] += 1
+            _cache.move_to_end(key)
+    if entry is not None:
+        return _restore(self, entry)
+
+    disk_path = _disk_path(self) if _settings["disk"] else None
+    if disk_path is not None and disk_path.exists():
+        entry = _load(disk_path)
+        with _lock:
+            stats["disk_hits"] += 1
+            _remember(key, entry)
+        return _restore(self, entry)
+
+    with _lock:
+        stats["misses"] += 1
+    self.generate_mobject()
+    entry = _snapshot(self)
+    if entry is not None:
+        with _lock:
+            _remember(key, entry)
+        if disk_path is not None:
+            _save(disk_path, entry)
+
+
+def log_stats(label):
+    with _lock:
+        counts = dict(stats)
+        stats.update(hits=0, disk_hits=0, misses=0)
+    logger.info(
+        "%(label)s parsed-SVG cache: %(hits)d hits, %(disk_hits)d disk hits, %(misses)d misses",
+        {"label": label, **counts},
+    )
+
+
+def _render_and_log(self, *args, **kwargs):
+    result = _wrapped["render"](self, *args, **kwargs)
+    log_stats(type(self).__name__)
+    return result
+
+
+def enable_svg_cache(maxsize=256, disk=True):
+    """
+    Parse each Tex SVG at most once per process (at most once ever with `disk`), keeping the
+    `maxsize` most recently used in memory. Only the Cairo renderer is covered; OpenGL
+    mobjects go through Manim's own path.
+    """
+    _settings.update(maxsize=maxsize, disk=disk)
+    if _settings["installed"]:
+        return
+    _settings["installed"] = True
+    _wrapped.update(init_svg_mobject=SVGMobject.init_svg_mobject, render=Scene.render)
+    SVGMobject.init_svg_mobject = _init_svg_mobject
+    Scene.render = _render_and_log
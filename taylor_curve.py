@@ -0,0 +1,98 @@
+"""
+taylor_curve.py
+
+A Taylor polynomial graph that follows a ValueTracker without being rebuilt.
+
+always_redraw(lambda: ax.plot(...)) constructs a new ParametricFunction every frame and
+re-evaluates every derivative and factorial for every sample. TaylorCurve keeps one
+fixed x grid and one set of Bezier points instead: when the tracker moves, only the y
+column is recomputed from the derivative table at a, and the points are written in place.
+
+For a known tracker animation the work can be moved out of the frame loop entirely:
+sweep_values lists the tracker value of every frame Scene.play will render, and
+TaylorCurve.precompute evaluates the curve for all of them as one (frames x samples)
+batch, so playback only copies a stored point buffer per frame.
+
+Classes:
+- TaylorCurve: Degree-`order` Taylor polynomial of f about tracker.get_value().
+
+Functions:
+- sweep_values(start, end, run_time, rate_func, frame_rate): Tracker value at each rendered frame.
+
+Dependencies: Requires Manim, numpy, derivatives and taylor_engine.
+
+"""
+
+from manim import *
+import numpy as np
+from derivatives import taylor_coefficients
+from taylor_engine import plot_grid, smoothing_matrix
+
+
+class TaylorCurve(VMobject):
+    """
+    `f` is anything derivatives.taylor_coefficients accepts: a registered series name
+    such as "cos" or a callable written with NumPy functions.
+    The curve is sampled on the same grid ax.plot uses, so it lines up with (and
+    transforms cleanly from) the static graphs of the same axes.
+    """
+
+    def __init__(self, ax, f, tracker, order, x_range=None, **kwargs):
+        super().__init__(**kwargs)
+        self.f = f
+        self.tracker = tracker
+        self.order = order
+        self.x = plot_grid(ax, x_range)
+
+        # Points are affine in y: fixed_points carries the origin and x part, y_direction the rest
+        origin = ax.c2p(0, 0)
+        self.smoothing = smoothing_matrix(len(self.x))
+        self.fixed_points = origin + np.outer(self.smoothing @ self.x, ax.c2p(1, 0) - origin)
+        self.y_direction = ax.c2p(0, 1) - origin
+        self.a = None
+        self.sweep = {}
+
+        self.update_curve()
+        self.add_updater(lambda mob: mob.update_curve())
+
+    def get_y(self, a):
+        coeffs = taylor_coefficients(self.f, self.order, a)
+        return np.polynomial.polynomial.polyval(self.x - a, coeffs)
+
+    def precompute(self, values):
+        """Store the points for every tracker value in `values`, evaluated as one batch."""
+        values = np.asarray(values, dtype=float)
+        coeffs = taylor_coefficients(self.f, self.order, values)
+        t = self.x - values[:, None]
+        y = np.zeros_like(t)
+        for c in coeffs[::-1]:
+            y = y * t + c[:, None]
+        frames = self.fixed_points + (y @ self.smoothing.T)[:, :, None] * self.y_direction
+        self.sweep.update(zip(np.round(values, 9), frames))
+        return self
+
+    def update_curve(self):
+        a = self.tracker.get_value()
+        if a == self.a:
+            return self
+        self.a = a
+        frame = self.sweep.get(np.round(a, 9))
+        if frame is None:
+            frame = self.fixed_points + np.outer(self.smoothing @ self.get_y(a), self.y_direction)
+        if self.points.shape == frame.shape:
+            self.points[:] = frame
+        else:
+            self.points = frame.copy()
+        return self
+
+
+def sweep_values(start, end, run_time=1, rate_func=smooth, frame_rate=None):
+    """
+    Values a tracker takes during tracker.animate.set_value(end) with the given run_time
+    and rate_func: one per frame at config.frame_rate (as Scene.play steps time), plus
+    the final value that Animation.finish sets.
+    """
+    frame_rate = frame_rate or config.frame_rate
+    alphas = np.append(np.arange(0, run_time, 1 / frame_rate) / run_time, 1.0)
+    alphas = np.array([rate_func(alpha) for alpha in alphas])
+    return (1 - alphas) * start + alphas * end
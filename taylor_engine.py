@@ -0,0 +1,199 @@
+"""
+taylor_engine.py
+
+Vectorized evaluation of Taylor polynomials for the series animations.
+
+Every approximation graph in the Taylor videos is a partial sum of one power series.
+Instead of letting ax.plot call a Python sum (with its factorials) once per sample,
+the scenes evaluate all partial sums S_0..S_N over a shared NumPy grid in one call
+and build their curves from the resulting arrays.
+
+Functions:
+- series_coefficients(term, count): Dense coefficient array from a (coefficient, power) term rule.
+- partial_sums(coeffs, x, a): All partial sums S_0..S_N of sum c_k (x-a)^k at once.
+- plot_grid(ax, x_range): The sample grid that ax.plot would use for the given axes.
+- plot_samples(ax, x, y, **kwargs): A smooth VMobject through precomputed samples.
+- smoothing_matrix(n): Linear map from n anchor values to the Bezier points make_smooth gives.
+- adaptive_samples(f, x_range, y_range, y_scale, tolerance): Samples refined where the curve is visible and bending.
+- clip_runs(x, y, y_range): Split samples into the runs inside y_range, ending exactly on its edges.
+- plot_runs(ax, runs, **kwargs): A smooth VMobject with one subpath per run.
+- plot_adaptive(ax, f, x_range, use_vectorized, **kwargs): Adaptive, clipped replacement for ax.plot.
+- plot_partial_sums(ax, coeffs, a, by_term, x_range, adaptive, lazy, **kwargs): One graph per partial sum.
+
+Dependencies: Requires Manim, numpy and lazy_mobjects.
+
+"""
+
+from functools import lru_cache
+from manim import *
+from manim.utils.bezier import get_smooth_handle_points
+import numpy as np
+from lazy_mobjects import LazyList
+
+
+def series_coefficients(term, count):
+    """Build dense coefficients c_0..c_d from `term(k) -> (coefficient, power)` for k < count."""
+    terms = [term(k) for k in range(count)]
+    coeffs = np.zeros(max(power for _, power in terms) + 1)
+    for coefficient, power in terms:
+        coeffs[power] += coefficient
+    return coeffs
+
+
+def partial_sums(coeffs, x, a=0.0):
+    """Return S with S[n] = sum_{k<=n} coeffs[k] * (x-a)^k, shape (len(coeffs), len(x))."""
+    coeffs = np.asarray(coeffs, dtype=float)
+    t = np.asarray(x, dtype=float) - a
+    powers = np.empty((len(coeffs),) + t.shape)
+    powers[0] = 1.0
+    if len(coeffs) > 1:
+        powers[1:] = t
+        np.cumprod(powers, axis=0, out=powers)
+    return np.cumsum(coeffs.reshape((-1,) + (1,) * t.ndim) * powers, axis=0)
+
+
+def plot_grid(ax, x_range=None):
+    """The x samples Axes.plot uses: a tenth of the tick step unless a step is given."""
+    t_range = np.array(ax.x_range, dtype=float)
+    if x_range is not None:
+        t_range[: len(x_range)] = x_range
+    if x_range is None or len(x_range) < 3:
+        t_range[2] /= ax.num_sampled_graph_points_per_tick
+    t_min, t_max, t_step = t_range
+    return np.append(np.arange(t_min, t_max, t_step), t_max)
+
+
+def plot_samples(ax, x, y, **kwargs):
+    """Smooth curve through (x, y) in the coordinates of `ax`, built like ax.plot builds it."""
+    origin = ax.c2p(0, 0)
+    points = (
+        origin
+        + np.outer(x, ax.c2p(1, 0) - origin)
+        + np.outer(y, ax.c2p(0, 1) - origin)
+    )
+    graph = VMobject(**kwargs)
+    graph.start_new_path(points[0])
+    graph.add_points_as_corners(points[1:])
+    graph.make_smooth()
+    return graph
+
+
+@lru_cache(maxsize=None)
+def smoothing_matrix(n):
+    """
+    make_smooth solves a fixed linear system for the handles of an open curve, so the
+    4(n-1) control points of a smoothed curve are C @ anchors. With the x samples fixed,
+    a curve whose y values change only needs C @ y to get its new points.
+    """
+    identity = np.eye(n)
+    h1, h2 = get_smooth_handle_points(identity)
+    C = np.empty((4 * (n - 1), n))
+    C[0::4] = identity[:-1]
+    C[1::4] = h1
+    C[2::4] = h2
+    C[3::4] = identity[1:]
+    C.setflags(write=False)
+    return C
+
+
+def adaptive_samples(f, x_range, y_range, y_scale=1.0, tolerance=0.005, initial=32, max_depth=8):
+    """
+    Start from `initial` uniform intervals and keep halving the ones whose midpoint is
+    more than `tolerance` scene units (y_scale units per y) off the chord. Values are
+    clipped to y_range before measuring, so intervals lying entirely off-screen are never
+    refined while intervals crossing the edge are, until the crossing is located.
+    `f` takes and returns arrays; non-finite values count as off-screen.
+    """
+    y_min, y_max = y_range[:2]
+
+    def clipped(y):
+        return np.clip(np.where(np.isfinite(y), y, np.inf), y_min, y_max)
+
+    x = np.linspace(x_range[0], x_range[1], initial + 1)
+    y = np.asarray(f(x), dtype=float)
+    for _ in range(max_depth):
+        mid = (x[:-1] + x[1:]) / 2
+        y_mid = np.asarray(f(mid), dtype=float)
+        c0, c1, cm = clipped(y[:-1]), clipped(y[1:]), clipped(y_mid)
+        off_screen = ((c0 == y_max) & (c1 == y_max) & (cm == y_max)) | ((c0 == y_min) & (c1 == y_min) & (cm == y_min))
+        split = ~off_screen & (np.abs(cm - (c0 + c1) / 2) * y_scale > tolerance)
+        if not split.any():
+            break
+        at = np.flatnonzero(split) + 1
+        x = np.insert(x, at, mid[split])
+        y = np.insert(y, at, y_mid[split])
+    return x, y
+
+
+def clip_runs(x, y, y_range):
+    """Runs of consecutive samples inside y_range, each extended to the edge it crosses."""
+    y_min, y_max = y_range[:2]
+    inside = np.isfinite(y) & (y >= y_min) & (y <= y_max)
+    edges = np.flatnonzero(np.diff(np.r_[0, inside.astype(int), 0]))
+    runs = []
+    for start, stop in zip(edges[0::2], edges[1::2]):
+        run = [(x[start:stop], y[start:stop])]
+        for outside, boundary in ((start - 1, start), (stop, stop - 1)):
+            if 0 <= outside < len(x) and np.isfinite(y[outside]):
+                edge = y_max if y[outside] > y_max else y_min
+                t = (edge - y[boundary]) / (y[outside] - y[boundary])
+                crossing = ([x[boundary] + t * (x[outside] - x[boundary])], [edge])
+                run.insert(0 if outside < start else len(run), crossing)
+        run_x, run_y = np.concatenate([r[0] for r in run]), np.concatenate([r[1] for r in run])
+        if len(run_x) > 1:
+            runs.append((run_x, run_y))
+    return runs
+
+
+def plot_runs(ax, runs, **kwargs):
+    """One smooth VMobject with a subpath per (x, y) run, mapped to scene points through ax."""
+    origin = ax.c2p(0, 0)
+    graph = VMobject(**kwargs)
+    for x, y in runs:
+        points = (
+            origin
+            + np.outer(x, ax.c2p(1, 0) - origin)
+            + np.outer(y, ax.c2p(0, 1) - origin)
+        )
+        graph.start_new_path(points[0])
+        graph.add_points_as_corners(points[1:])
+    graph.make_smooth()
+    return graph
+
+
+def plot_adaptive(ax, f, x_range=None, use_vectorized=False, tolerance=0.005, **kwargs):
+    """Like ax.plot, but adaptively sampled and clipped to the y_range of the axes."""
+    x_range = ax.x_range if x_range is None else x_range
+    y_scale = np.linalg.norm(ax.c2p(0, 1) - ax.c2p(0, 0))
+    if not use_vectorized:
+        f = np.vectorize(f, otypes=[float])
+    x, y = adaptive_samples(f, x_range, ax.y_range, y_scale, tolerance)
+    return plot_runs(ax, clip_runs(x, y, ax.y_range), **kwargs)
+
+
+def plot_partial_sums(ax, coeffs, a=0.0, by_term=False, x_range=None, adaptive=False, lazy=False, **kwargs):
+    """
+    Graphs of the partial sums of sum c_k (x-a)^k. On the uniform grid they are all
+    sampled in one batched call.
+
+    With by_term=True the n-th graph holds the first n+1 non-zero terms
+    (cos(x) -> 1, 1 - x^2/2!, ...) instead of all terms up to degree n.
+    With adaptive=True each graph is sampled by plot_adaptive instead of on the
+    uniform ax.plot grid, which suits partial sums that leave the y_range quickly;
+    each refinement pass evaluates only that graph's polynomial (Horner's scheme).
+    With lazy=True the result is a LazyList: each graph mobject is only built when it
+    is first indexed. Uniform-grid samples are still computed up front; adaptive ones
+    are computed when their graph is built.
+    """
+    orders = np.flatnonzero(coeffs) if by_term else np.arange(len(coeffs))
+    if adaptive:
+        build = lambda i: plot_adaptive(
+            ax, lambda x: np.polynomial.polynomial.polyval(x - a, coeffs[:orders[i] + 1]), x_range, use_vectorized=True, **kwargs
+        )
+    else:
+        x = plot_grid(ax, x_range)
+        sums = partial_sums(coeffs, x, a)[orders]
+        build = lambda i: plot_samples(ax, x, sums[i], **kwargs)
+    if lazy:
+        return LazyList(build, len(orders), prefetch=1)
+    return [build(i) for i in range(len(orders))]
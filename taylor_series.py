@@ -20,8 +20,14 @@ Each class uses Manim to construct animations demonstrating various aspects of T
 
 Functions:
 - dcos(n, a): Defines the derivative of cos(x) used in the Taylor series expansions.
-- maclaurine_exp(x): Computes the Maclaurin series expansion of cos(x) around x = 0.
-- taylor_exp(x): Computes the Taylor series expansion of cos(x) around x = π.
+- maclaurine_exp(x): Maclaurin partial sum of cos(x) within epsilon of cos(x), and its number of terms.
+- taylor_exp(x): The same for the Taylor series of cos(x) around x = π.
+
+The approximation graphs are sampled in one batched call per series through taylor_engine.
+Parsed Tex glyphs are cached across MathTex objects and runs through svg_cache, and the
+moving "a = ..." labels are assembled from a glyph_atlas instead of being recompiled per value.
+Partial movie files are named by animation_cache content hashes, so editing one play only
+re-renders the segments whose frames change.
 
 Dependencies: Requires Manim and standard Python libraries (numpy, math).
 
@@ -30,36 +36,31 @@ Dependencies: Requires Manim and standard Python libraries (numpy, math).
 from manim import *
 import numpy as np
 import math as m
+from taylor_engine import plot_partial_sums
+from series_registry import dense_coefficients
+from taylor_curve import TaylorCurve, sweep_values
+from derivatives import nth_derivative, taylor_coefficients, terms_to_tolerance
+from glyph_atlas import GlyphAtlas
+from lazy_mobjects import LazyList, LazyMobjects
+from axes_cache import background, shared_axes
+from render_tools import enable_render_stack
+
+enable_render_stack()
 
 # Function definitions (dcos, maclaurine_exp, taylor_exp) are defined here.
 
 def dcos(n,a):
-   if(n%4==1):
-      return -np.sin(a)
-   elif(n%4==2):
-      return -np.cos(a)
-   elif(n%4==3):
-      return np.sin(a)
-   else:
-      return np.cos(a)
+   # Works on arrays of a; use derivative_table("cos", N, a) for all orders at once
+   return nth_derivative("cos",n,a)
 
 epsilon = 0.001
 
+# x may be an array; terms are -1 where the series does not reach epsilon
 def maclaurine_exp(x):
-   sum = 0
-   i=0
-   while(abs(sum-np.cos(4))>epsilon):
-    sum += dcos(i,0)*x**i/m.factorial(i)
-    i+=1
-   return sum,i
+   return terms_to_tolerance("cos", x, 0, epsilon)
 
 def taylor_exp(x):
- sum = 0
- i=0
- while(abs(sum-np.cos(4))>epsilon):
-   sum += dcos(i,np.pi)*(x-np.pi)**i/m.factorial(i)
-   i+=1
- return sum,i
+   return terms_to_tolerance("cos", x, np.pi, epsilon)
 
 
 class TaylorSeriesFormula(Scene):
@@ -93,19 +94,14 @@ class CosExpansion(Scene):
             color=BLUE
         )
         tex.move_to(2 * DOWN)
-        ax = Axes((-6, 6), (-3, 3))
-        labels = ax.get_axis_labels(x_label="x", y_label=MathTex(r"f(x)=cos(x)"))
+        ax = shared_axes((-6, 6), (-3, 3))
+        labels = background(ax.get_axis_labels(x_label="x", y_label=MathTex(r"f(x)=cos(x)")))
         graph1 = ax.plot(lambda x: m.cos(x), color=PINK)
 
-        graphs = [
-            ax.plot(lambda x, n=n: sum(
-                (-1)**k * x**(2*k) / m.factorial(2*k) for k in range(n+1)
-            ), color=YELLOW_E) for n in range(10)
-        ]
+        # Built on first use: tex and ax do not move, so the layout is the same as building them here
+        graphs = plot_partial_sums(ax, dense_coefficients("cos", 10), by_term=True, lazy=True, color=YELLOW_E)
 
-        recs = [
-            SurroundingRectangle(VGroup(tex[0], tex[i]), color=WHITE) for i in range(1, 9)
-        ]
+        recs = LazyList(lambda i: SurroundingRectangle(VGroup(tex[0], tex[i + 1]), color=WHITE), 8)
 
         self.play(Create(ax), Create(graph1), Create(labels))
         self.wait(2)
@@ -134,19 +130,16 @@ class CosExpansion2(Scene):
         ).scale(0.6)
         tex.move_to(2 * DOWN)
 
-        ax = Axes((-6, 6), (-3, 3))
-        labels = ax.get_axis_labels(x_label="x", y_label=MathTex("f(x)=cos(x)"))
+        ax = shared_axes((-6, 6), (-3, 3))
+        labels = background(ax.get_axis_labels(x_label="x", y_label=MathTex("f(x)=cos(x)")))
         graph1 = ax.plot(lambda x: m.cos(x), color=PINK)
 
         dot = always_redraw(lambda: Dot().move_to(ax.c2p(a.get_value(), np.cos(a.get_value()))))
         self.add(ax, graph1, labels, dot)
         self.play(a.animate.set_value(2))
 
-        graphs = [
-            ax.plot(lambda x, n=n: sum(
-                dcos(k, a.get_value()) * (x - a.get_value())**k / m.factorial(k) for k in range(n+1)
-            ), color=YELLOW_E) for n in range(9)
-        ]
+        coeffs = taylor_coefficients("cos", 8, a.get_value())
+        graphs = plot_partial_sums(ax, coeffs, a=a.get_value(), color=YELLOW_E)
 
         self.wait(2)
         self.play(Create(tex[0]))
@@ -169,15 +162,11 @@ class SinExpansion(Scene):
         )
         tex.move_to(2 * DOWN)
 
-        ax = Axes((-6, 6), (-3, 3))
-        labels = ax.get_axis_labels(x_label="x", y_label="f(x)=sin(x)")
+        ax = shared_axes((-6, 6), (-3, 3))
+        labels = background(ax.get_axis_labels(x_label="x", y_label="f(x)=sin(x)"))
         graph1 = ax.plot(lambda x: m.sin(x), color=RED)
 
-        graphs = [
-            ax.plot(lambda x, n=n: sum(
-                (-1)**k * x**(2*k+1) / m.factorial(2*k+1) for k in range(n+1)
-            ), color=YELLOW_E) for n in range(10)
-        ]
+        graphs = plot_partial_sums(ax, dense_coefficients("sin", 10), by_term=True, color=YELLOW_E)
 
         self.play(Create(ax), Create(graph1), Create(labels), Create(tex[0]))
         self.play(Create(VGroup(graphs[0], tex[1])))
@@ -199,14 +188,11 @@ class eExpansion(Scene):
             color=BLUE
         ).move_to(2 * DOWN)
 
-        ax = Axes((-6, 6), (-3, 3))
-        labels = ax.get_axis_labels(x_label="x", y_label=MathTex("f(x)=e^x"))
+        ax = shared_axes((-6, 6), (-3, 3))
+        labels = background(ax.get_axis_labels(x_label="x", y_label=MathTex("f(x)=e^x")))
         graph1 = ax.plot(lambda x: m.e**x, color=PINK)
 
-        def taylor_series_approx(n):
-            return ax.plot(lambda x: sum(x**k / m.factorial(k) for k in range(n + 1)), color=YELLOW_E)
-
-        graphs = [taylor_series_approx(n) for n in range(10)]
+        graphs = plot_partial_sums(ax, dense_coefficients("e^x", 10), color=YELLOW_E)
 
         self.play(Create(ax), Create(graph1), Create(labels))
         self.play(Create(tex[0]))
@@ -223,11 +209,10 @@ class eExpansion(Scene):
 
 class TaylorProofCos(Scene):
     def construct(self):
-        # Taylor series representations
-        series1 = MathTex("cos(x) = 1 - \\frac{1}{2}x^2","+ \\frac{1}{24}x^4 -","\\frac{1}{720}x^6 +","............", color=BLUE).move_to(DOWN)
-        series2 = MathTex("cos(x) = 1 - \\frac{1}{2!}x^2","+ \\frac{1}{4!}x^4 -","\\frac{1}{6!}x^6 +","............", color=BLUE).move_to(DOWN)
-        series3 = MathTex("cos(-x) = 1 - \\frac{1}{2!}(-x)^2","+ \\frac{1}{4!}(-x)^4 -","\\frac{1}{6!}(-x)^6 +","............", color=BLUE).move_to(DOWN)
-        series4 = MathTex("cos(x) = 1 - \\frac{1}{2!}x^2","+ \\frac{1}{4!}x^4 -","\\frac{1}{6!}x^6 +","............", color=BLUE).move_to(DOWN)
+        # Built on first use (and prefetched in the background, in declaration order, so
+        # declared in order of use): only placed at absolute positions or on ax/tex2, which
+        # do not move before they are needed
+        later = LazyMobjects(prefetch=2)
 
         # Definitions and expressions
         tex1 = MathTex("f(","x",")","=","cos(","x",")", color=BLUE).move_to(3 * UP + 4.5 * LEFT)
@@ -241,10 +226,15 @@ class TaylorProofCos(Scene):
 
         # Polynomial approximation
         tex2 = MathTex("p(x) = ","a_0"," + ","a_1","x"," + ","a_2","x^2"," + ","a_3","x^3","+","a_4","x^4","..........", color=BLUE).next_to(tex1, RIGHT, buff=0.8)
-        tex2_0 = MathTex("p(x) = ","1"," + ","0","x"," - ","\\frac{1}{2}","x^2"," + ","0","x^3","+","\\frac{1}{24}","x^4","+..........", color=BLUE).next_to(tex1, RIGHT, buff=0.8)
-        
-        for i in range(3, len(tex2_0)): 
-            tex2_0[i].move_to(tex2[i].get_center() + 0.05 * DOWN)
+
+        def build_tex2_0():
+            tex2_0 = MathTex("p(x) = ","1"," + ","0","x"," - ","\\frac{1}{2}","x^2"," + ","0","x^3","+","\\frac{1}{24}","x^4","+..........", color=BLUE).next_to(tex1, RIGHT, buff=0.8)
+            for i in range(3, len(tex2_0)):
+                tex2_0[i].move_to(tex2[i].get_center() + 0.05 * DOWN)
+            tex2_0[3].move_to(tex2[3].get_center() + 0.1 * UP)
+            return tex2_0
+
+        later["tex2_0"] = build_tex2_0
 
         tex2_1 = MathTex("p(","0",")","=","a_0"," + ","a_1","0"," + ","a_2","0^2"," + ","a_3","0^3","+","a_4","0^4","+..........").next_to(tex2, DOWN, buff=0.8)
         tex2_2 = MathTex("p'(x)","=","a_1"," + " ,"2a_2","x"," + ","3a_3","x^2"," + ","4a_4","x^3","............").next_to(tex2_1, DOWN, buff=0.8)
@@ -256,8 +246,6 @@ class TaylorProofCos(Scene):
         tex3_3 = MathTex("0 = a_3").next_to(tex3_1[1], DOWN, buff=0.8)
         tex3_4 = MathTex("\\frac{1}{24} = a_4").next_to(tex3_1[1], DOWN, buff=0.8)
 
-        tex2_0[3].move_to(tex2[3].get_center() + 0.1 * UP)
-
         cos_vals = [
             MathTex("1", "1").move_to(tex1_1[3]),
             MathTex("0", "0").move_to(tex1_2_1[3]),
@@ -266,11 +254,17 @@ class TaylorProofCos(Scene):
         ]
 
         # Axes and graphs
-        ax = Axes(x_range=(-3.14, 3.14), x_length=10, y_range=[-2, 2], y_length=5).move_to(4 * RIGHT + UP).scale(0.6)
+        ax = shared_axes(x_range=(-3.14, 3.14), x_length=10, y_range=[-2, 2], y_length=5).move_to(4 * RIGHT + UP).scale(0.6)
         graph1 = ax.plot(lambda x: m.cos(x), color=PINK)
-        graph2 = ax.plot(lambda x: 1, color=YELLOW_E)
-        graph3 = ax.plot(lambda x: 1 - x**2 / m.factorial(2), color=YELLOW_E)
-        graph4 = ax.plot(lambda x: 1 - x**2 / m.factorial(2) + x**4 / m.factorial(4), color=YELLOW_E)
+        later["graph2"] = lambda: ax.plot(lambda x: 1, color=YELLOW_E)
+        later["graph3"] = lambda: ax.plot(lambda x: 1 - x**2 / m.factorial(2), color=YELLOW_E)
+        later["graph4"] = lambda: ax.plot(lambda x: 1 - x**2 / m.factorial(2) + x**4 / m.factorial(4), color=YELLOW_E)
+
+        # Taylor series representations
+        later["series1"] = lambda: MathTex("cos(x) = 1 - \\frac{1}{2}x^2","+ \\frac{1}{24}x^4 -","\\frac{1}{720}x^6 +","............", color=BLUE).move_to(DOWN)
+        later["series2"] = lambda: MathTex("cos(x) = 1 - \\frac{1}{2!}x^2","+ \\frac{1}{4!}x^4 -","\\frac{1}{6!}x^6 +","............", color=BLUE).move_to(DOWN)
+        later["series3"] = lambda: MathTex("cos(-x) = 1 - \\frac{1}{2!}(-x)^2","+ \\frac{1}{4!}(-x)^4 -","\\frac{1}{6!}(-x)^6 +","............", color=BLUE).move_to(DOWN)
+        later["series4"] = lambda: MathTex("cos(x) = 1 - \\frac{1}{2!}x^2","+ \\frac{1}{4!}x^4 -","\\frac{1}{6!}x^6 +","............", color=BLUE).move_to(DOWN)
 
         line = Line(start=[-2.5, 3, 0], end=[-2.5, -3, 0])
 
@@ -285,7 +279,7 @@ class TaylorProofCos(Scene):
         self.wait()
         self.play(ReplacementTransform(tex2_1[0:3], cos_vals[0][1]))
         self.wait()
-        self.play(ReplacementTransform(tex2[1], tex2_0[1]), Create(graph2))
+        self.play(ReplacementTransform(tex2[1], later["tex2_0"][1]), Create(later["graph2"]))
         self.wait()
         self.play(Create(tex1_2), Create(tex2_2))
         self.wait()
@@ -293,7 +287,7 @@ class TaylorProofCos(Scene):
         self.play(FadeOut(tex2_2_1[3:]))
         self.play(ReplacementTransform(tex1_2_1[4:7], cos_vals[1][0]), ReplacementTransform(tex2_2_1[0], cos_vals[1][1]))
         self.wait()
-        self.play(ReplacementTransform(tex2[3], tex2_0[3]))
+        self.play(ReplacementTransform(tex2[3], later["tex2_0"][3]))
         self.wait()
         self.play(Write(tex1_3), Write(tex3))
         self.wait()
@@ -304,26 +298,26 @@ class TaylorProofCos(Scene):
         self.play(Transform(tex3_1[0], cos_vals[2][1]))
         self.play(ReplacementTransform(tex3_1[0:3], tex3_2))
         self.wait()
-        self.play(ReplacementTransform(tex2[5:7], tex2_0[5:7]), ReplacementTransform(graph2, graph3))
+        self.play(ReplacementTransform(tex2[5:7], later["tex2_0"][5:7]), ReplacementTransform(later["graph2"], later["graph3"]))
         self.wait()
         self.play(Write(tex1_3_2), Write(tex3_3))
         self.wait()
-        self.play(ReplacementTransform(tex2[9], tex2_0[9]))
+        self.play(ReplacementTransform(tex2[9], later["tex2_0"][9]))
         self.wait()
         self.play(ReplacementTransform(tex1_3_2, tex1_3_3), ReplacementTransform(tex3_3, tex3_4))
         self.wait()
-        self.play(ReplacementTransform(tex2[12], tex2_0[12]), ReplacementTransform(graph3, graph4))
+        self.play(ReplacementTransform(tex2[12], later["tex2_0"][12]), ReplacementTransform(later["graph3"], later["graph4"]))
         self.wait()
         self.play(FadeOut(VGroup(line, tex1_3_3, tex3_3, tex1, tex1_1[0:4], tex1_2_1[0:4], tex1_3_1[0:4], *cos_vals, tex3_4, tex3_2, tex2_1[3:5], tex2_2_1[1:3])))
         self.wait()
-        self.play(ReplacementTransform(tex2, series1), FadeOut(VGroup(tex2_0[5:7], tex2_0[9], tex2_0[12])))
+        self.play(ReplacementTransform(tex2, later["series1"]), FadeOut(VGroup(later["tex2_0"][5:7], later["tex2_0"][9], later["tex2_0"][12])))
         self.wait(2)
-        self.play(ReplacementTransform(series1, series2))
+        self.play(ReplacementTransform(later["series1"], later["series2"]))
         self.wait(2)
-        self.play(ReplacementTransform(series2, series3))
+        self.play(ReplacementTransform(later["series2"], later["series3"]))
         self.wait()
-        self.play(ReplacementTransform(series3, series4))
-        self.play(Create(SurroundingRectangle(series2, color=YELLOW)))
+        self.play(ReplacementTransform(later["series3"], later["series4"]))
+        self.play(Create(SurroundingRectangle(later["series2"], color=YELLOW)))
         self.wait()
 
 
@@ -377,20 +371,17 @@ class GeneralProof(Scene):
       
        k = ValueTracker(0)
        
-       ax = Axes((-6,6),(-3,3)).move_to(DOWN)
+       ax = shared_axes((-6,6),(-3,3)).move_to(DOWN)
       #  labels = ax.get_axis_labels(x_label="x",y_label=MathTex(r"f(x)=cos(x)"))
        
        graph = ax.plot(lambda x: np.cos(x))
-       graphs = [
-            ax.plot(lambda x, n=n: sum(
-                (-1)**k * x**(2*k) / m.factorial(2*k) for k in range(n+1)
-            ), color=YELLOW_E) for n in range(5)
-        ]
+       graphs = plot_partial_sums(ax, dense_coefficients("cos", 5), by_term=True, color=YELLOW_E)
       
        dot = always_redraw(lambda: Dot().move_to(ax.c2p(k.get_value(),np.cos(k.get_value()),0)))
        line = always_redraw(lambda: DashedLine(start=ax.c2p(k.get_value(),0,0), end=ax.c2p(k.get_value(), graph.underlying_function(k.get_value()),0)))
        brace = always_redraw(lambda: Brace(line,RIGHT))
-       tex0 = always_redraw(lambda: Tex(f"a = {round(k.get_value(),2)}").next_to(ax.c2p(k.get_value(),0,0),UP).scale(0.5))
+       atlas = GlyphAtlas("a = ")
+       tex0 = always_redraw(lambda: atlas.label(round(k.get_value(),2)).next_to(ax.c2p(k.get_value(),0,0),UP).scale(0.5))
        tex0_1 = always_redraw(lambda: Tex(f"f(a)").next_to(brace,RIGHT,buff=0.1).scale(0.5))
        
        self.play(Create(ax),Create(graph),Create(dot), Write(tex0),Write(tex0_1),Write(brace),Create(line))
@@ -407,15 +398,9 @@ class GeneralProof(Scene):
        
        a = 3
 
-       Graphs = [
-            ax.plot(lambda x, n=n: sum(
-                dcos(k, a) * (x - a)**k / m.factorial(k) for k in range(n+1)
-            ), color=YELLOW_E) for n in range(5)
-        ]
+       Graphs = plot_partial_sums(ax, taylor_coefficients("cos", 4, a), a=a, color=YELLOW_E)
        
-       Graph9 = always_redraw(lambda: ax.plot(lambda x: np.cos(k.get_value())+ dcos(1,k.get_value())*(x-k.get_value())/m.factorial(1)+ dcos(2,k.get_value())*(x-k.get_value())**2/m.factorial(2)+ 
-                                              dcos(3,k.get_value())*(x-k.get_value())**3/m.factorial(3)+ dcos(4,k.get_value())*(x-k.get_value())**4/m.factorial(4)+ dcos(5,k.get_value())*(x-k.get_value())**5/m.factorial(5)+ 
-                                              dcos(6,k.get_value())*(x-k.get_value())**6/m.factorial(6)+ dcos(7,k.get_value())*(x-k.get_value())**7/m.factorial(7),color=YELLOW_E))
+       Graph9 = TaylorCurve(ax, "cos", k, 7, color=YELLOW_E)
        
        self.play(Create(tex[0]))
        self.play(Create(VGroup(Graphs[0],tex[1])))
@@ -423,6 +408,7 @@ class GeneralProof(Scene):
         self.play(ReplacementTransform(Graphs[i-1],Graphs[i]),Write(tex[i+1]))
        
        self.play(ReplacementTransform(Graphs[4],Graph9))
+       Graph9.precompute(sweep_values(k.get_value(), -1, run_time=2))
        self.wait(2)
        self.play(k.animate.set_value(-1),run_time=2)
        self.wait()
@@ -433,7 +419,7 @@ class TaylorVsMaclaurine(Scene):
         k = ValueTracker(0)
         
         # Setup axes
-        ax = Axes(x_range=(-1, 5), y_range=(-2, 2), axis_config={"include_numbers": True})
+        ax = shared_axes(x_range=(-1, 5), y_range=(-2, 2), axis_config={"include_numbers": True})
         
         # Define graphs for cosine and its Taylor/Maclaurin series approximations
         graphs = [
@@ -475,12 +461,8 @@ class TaylorVsMaclaurine(Scene):
             ax.plot(lambda x: np.cos(a) + (x-a)**2 / m.factorial(2) - (x-a)**4 / m.factorial(4) + (x-a)**6 / m.factorial(6), color=RED_E)
         ]
 
-        # Redraw Taylor series graph based on tracker value
-        def taylor_series_func(x):
-            a = k.get_value()
-            return np.cos(a) + sum(dcos(n, a) * (x-a)**n / m.factorial(n) for n in range(1, 7))
-
-        dynamic_taylor_graph = always_redraw(lambda: ax.plot(taylor_series_func, color=YELLOW_E))
+        # Taylor series graph that follows the tracker value, updated in place
+        dynamic_taylor_graph = TaylorCurve(ax, "cos", k, 6, color=YELLOW_E)
 
         # Play graph transformations
         self.play(Create(taylor_graphs[0]), Create(graphs[1]))
@@ -492,24 +474,31 @@ class TaylorVsMaclaurine(Scene):
 
 
 class Thumbnail(Scene):
+   # Overridden per variant by render_tools.render_stills
+   titles = ("A Polynomial Approximation of a ", "Non-Polynomial Function")
+   curve_color = PINK
+   a = 2.5
+   variants = [{}, {"name": "ThumbnailBlue", "curve_color": BLUE}, {"name": "ThumbnailA", "a": -1}]
+
    def construct(self):
-      k= ValueTracker(2.5)
-      ax = Axes((-6,6),(-2,2),y_length=4).move_to(1.8*DOWN)
+      k= ValueTracker(self.a)
+      ax = shared_axes((-6,6),(-2,2),y_length=4).move_to(1.8*DOWN)
       tex9 = MathTex("f(x) = \sum_{n=0}^{\infty}","\\frac{f^n(a)}{n!}","(x-a)^n").move_to(0.6*UP).scale(1.3)
-      tex9_1 = Tex("A Polynomial Approximation of a ").scale(1.5).move_to(3.5*UP)
+      tex9_1 = Tex(self.titles[0]).scale(1.5).move_to(3.5*UP)
       # tex9_1[0].set_color(BLUE)
-      tex10 = Tex("Non-Polynomial Function").next_to(tex9_1,DOWN,buff=0.5).scale(1.5)
+      tex10 = Tex(self.titles[1]).next_to(tex9_1,DOWN,buff=0.5).scale(1.5)
       tex = MathTex("f(x) = ","f(a)"," + f'(a)\\frac{(x-a)^1}{1!}"," + f''(a)\\frac{(x-a)^2}{2!}"," + f'''(a)\\frac{(x-a)^3}{3!}"," + f''''(a)\\frac{(x-a)^4}{4!}","+ ............\infty",color=BLUE).scale(0.6)
       tex.move_to(3.5*DOWN)
       arrow = Arrow(start=ax.c2p(0,1,0),end= ax.c2p(0.8,1.8,0),color=YELLOW_E)
       #  labels = ax.get_axis_labels(x_label="x",y_label=MathTex(r"f(x)=cos(x)"))
        
-      graph1 = ax.plot(lambda x: m.cos(x),color=PINK)
-      Graph9 = always_redraw(lambda: ax.plot(lambda x: np.cos(k.get_value())+ dcos(1,k.get_value())*(x-k.get_value())/m.factorial(1)+ dcos(2,k.get_value())*(x-k.get_value())**2/m.factorial(2)+ dcos(3,k.get_value())*(x-k.get_value())**3/m.factorial(3)+ dcos(4,k.get_value())*(x-k.get_value())**4/m.factorial(4)+ dcos(5,k.get_value())*(x-k.get_value())**5/m.factorial(5)+ dcos(6,k.get_value())*(x-k.get_value())**6/m.factorial(6)+ dcos(7,k.get_value())*(x-k.get_value())**7/m.factorial(7),color=YELLOW_E))
+      graph1 = ax.plot(lambda x: m.cos(x),color=self.curve_color)
+      Graph9 = TaylorCurve(ax, "cos", k, 7, color=YELLOW_E)
       dot = always_redraw(lambda: Dot().move_to(ax.c2p(k.get_value(),np.cos(k.get_value()),0)))
       line = always_redraw(lambda: DashedLine(start=ax.c2p(k.get_value(),0,0), end=ax.c2p(k.get_value(), graph1.underlying_function(k.get_value()),0)))
       brace = always_redraw(lambda: Brace(line,RIGHT))
-      tex0 = always_redraw(lambda: Tex(f"a = {round(k.get_value(),2)}").next_to(ax.c2p(k.get_value(),0,0),UP).scale(0.5))
+      atlas = GlyphAtlas("a = ")
+      tex0 = always_redraw(lambda: atlas.label(round(k.get_value(),2)).next_to(ax.c2p(k.get_value(),0,0),UP).scale(0.5))
       tex0_1 = always_redraw(lambda: Tex(f"f(a)").next_to(brace,RIGHT,buff=0.1).scale(0.5))
 
       self.add(ax,tex9,tex9_1,tex,graph1,Graph9,dot,line,brace,tex0,tex0_1,tex10)
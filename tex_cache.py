@@ -0,0 +1,156 @@
+"""
+tex_cache.py
+
+Batch precompilation of the LaTeX used by the scene scripts into Manim's Tex cache.
+
+Manim keys its cache on the hash of the full .tex source (media/Tex/<hash>.tex/.svg) and,
+on a miss, runs one latex and one dvisvgm process for that expression when the MathTex
+is constructed. A MathTex with k parts needs k+1 expressions (the joined string and each
+part). This module finds those expressions ahead of time by reading the scene module's
+source, compiles all of the missing ones as pages of a few multi-page documents (one per
+worker, in parallel), and splits the pages back into the per-hash SVG files Manim looks
+for. Scenes rendered afterwards only hit the cache.
+
+Only literal strings can be collected statically: f-strings and starred arguments are
+left for Manim to compile on first use.
+
+Functions:
+- collect_tex(path): (expression, environment) pairs of every literal MathTex/Tex in a module.
+- precompile_tex(entries, processes, tex_template): Compile the missing entries into the cache.
+- precompile_module(path, processes): collect_tex + precompile_tex for one scene module.
+
+Usage: python tex_cache.py taylor_series.py newton_raphson.py
+
+Dependencies: Requires Manim, a LaTeX distribution and dvisvgm.
+
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import ast
+import hashlib
+import os
+import re
+import subprocess
+import sys
+from manim import *
+from manim.utils.tex_file_writing import compile_tex, convert_to_svg, generate_tex_file
+
+TEX_CLASSES = {"MathTex": (" ", "align*"), "Tex": ("", "center")}
+
+# _get_modified_expression only needs the class's string helpers, not a built mobject
+_modifier = SingleStringMathTex.__new__(SingleStringMathTex)
+
+
+def _literal(node):
+    return node.value if isinstance(node, ast.Constant) and isinstance(node.value, str) else None
+
+
+def _call_entries(node):
+    name = node.func.id if isinstance(node.func, ast.Name) else getattr(node.func, "attr", None)
+    if name == "get_axis_labels":
+        # String axis labels are turned into MathTex
+        labels = [_literal(keyword.value) for keyword in node.keywords if keyword.arg in ("x_label", "y_label")]
+        return [(label, "align*") for label in labels if label is not None]
+    if name not in TEX_CLASSES:
+        return []
+    separator, environment = TEX_CLASSES[name]
+    if any(keyword.arg in ("substrings_to_isolate", "tex_to_color_map") for keyword in node.keywords):
+        # These split the parts further at run time
+        return []
+    for keyword in node.keywords:
+        if keyword.arg == "arg_separator" and _literal(keyword.value) is not None:
+            separator = _literal(keyword.value)
+        elif keyword.arg == "tex_environment" and _literal(keyword.value) is not None:
+            environment = _literal(keyword.value)
+    args = [_literal(arg) for arg in node.args]
+    parts = [piece for arg in args if arg is not None for piece in re.split("{{(.*?)}}", arg) if piece]
+    entries = [(part, environment) for part in parts]
+    if None not in args:
+        entries.append((separator.join(parts), environment))
+    return entries
+
+
+def collect_tex(path):
+    tree = ast.parse(Path(path).read_text(encoding="utf-8"))
+    entries = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Call):
+            entries.extend(_call_entries(node))
+    return [(_modifier._get_modified_expression(expression), environment) for expression, environment in entries]
+
+
+def _compile_single(tex_file, tex_template):
+    dvi_file = compile_tex(tex_file, tex_template.tex_compiler, tex_template.output_format)
+    return convert_to_svg(dvi_file, tex_template.output_format)
+
+
+def _compile_batch(tex_files, tex_template):
+    """Compile tex_files as the pages of one document and give each page its cache name."""
+    codes = [tex_file.read_text(encoding="utf-8") for tex_file in tex_files]
+    preamble = codes[0].partition(r"\begin{document}")[0]
+    preamble, is_standalone = re.subn(
+        r"\\documentclass\[(.*?)\]\{standalone\}", r"\\documentclass[\1,multi=manimpage]{standalone}", preamble, count=1
+    )
+    if not is_standalone:
+        raise ValueError("Batch compilation needs a standalone-class TeX template")
+    pages = [code.partition(r"\begin{document}")[2].rpartition(r"\end{document}")[0] for code in codes]
+    body = "".join(f"\\begin{{manimpage}}{page}\\end{{manimpage}}\n" for page in pages)
+
+    tex_dir = config.get_dir("tex_dir")
+    name = "batch_" + hashlib.sha256("".join(f.stem for f in tex_files).encode()).hexdigest()[:16]
+    batch_file = tex_dir / f"{name}.tex"
+    batch_file.write_text(f"{preamble}\\begin{{document}}\n{body}\\end{{document}}\n", encoding="utf-8")
+    dvi_file = compile_tex(batch_file, tex_template.tex_compiler, tex_template.output_format)
+    command = ["dvisvgm", *(["--pdf"] if tex_template.output_format == ".pdf" else []), "-p", "1-", dvi_file.as_posix(),
+               "-n", "-v", "0", "-o", f"{(tex_dir / name).as_posix()}-%p.svg"]
+    try:
+        subprocess.run(command, check=True, stdout=subprocess.DEVNULL)
+    except subprocess.CalledProcessError as error:
+        # Left on disk to be inspected; the pages are compiled one by one instead
+        raise ValueError(f"dvisvgm exited with status {error.returncode} on {batch_file}") from error
+    for svg_file in tex_dir.glob(f"{name}-*.svg"):
+        page = int(svg_file.stem.rpartition("-")[2])
+        svg_file.replace(tex_files[page - 1].with_suffix(".svg"))
+    batch_file.unlink()
+    missing = [tex_file for tex_file in tex_files if not tex_file.with_suffix(".svg").exists()]
+    if missing:
+        raise ValueError(f"{len(missing)} pages of {batch_file.name} were not converted")
+
+
+def _compile_chunk(tex_files, tex_template):
+    try:
+        _compile_batch(tex_files, tex_template)
+    except ValueError as error:
+        logger.info("Batch TeX compilation failed (%(error)s), compiling one by one", {"error": str(error)})
+        for tex_file in tex_files:
+            if not tex_file.with_suffix(".svg").exists():
+                _compile_single(tex_file, tex_template)
+
+
+def precompile_tex(entries, processes=None, tex_template=None):
+    """
+    Write the .tex file of every (expression, environment) entry and compile those without
+    a cached SVG, split over `processes` (default: one per core) multi-page documents
+    compiled concurrently. Returns the number of expressions compiled.
+    """
+    tex_template = tex_template or config["tex_template"]
+    tex_files = sorted({generate_tex_file(expression, environment, tex_template) for expression, environment in entries})
+    missing = [tex_file for tex_file in tex_files if not tex_file.with_suffix(".svg").exists()]
+    if not missing:
+        return 0
+    workers = min(processes or os.cpu_count(), len(missing))
+    chunks = [missing[i::workers] for i in range(workers)]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        list(pool.map(_compile_chunk, chunks, [tex_template] * workers))
+    logger.info("Precompiled %(count)d TeX expressions", {"count": len(missing)})
+    return len(missing)
+
+
+def precompile_module(path, processes=None):
+    return precompile_tex(collect_tex(path), processes)
+
+
+if __name__ == "__main__":
+    for module_path in sys.argv[1:]:
+        precompile_module(module_path)